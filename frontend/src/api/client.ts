@@ -512,6 +512,24 @@ export function removeStoryFromCampaign(campaignId: string, storyId: string) {
   });
 }
 
+export function addStoriesToCampaign(campaignId: string, storyIds: string[]) {
+  return request<{ status: string; linked: number }>(
+    `/campaigns/${campaignId}/stories/bulk`,
+    {
+      method: "POST",
+      body: JSON.stringify({ story_ids: storyIds }),
+    },
+  );
+}
+
+export function removeStoriesFromCampaign(campaignId: string, storyIds: string[]) {
+  const qs = new URLSearchParams();
+  for (const id of storyIds) qs.append("story_id", id);
+  return request<void>(`/campaigns/${campaignId}/stories?${qs}`, {
+    method: "DELETE",
+  });
+}
+
 // -- Briefs API --
 
 export function fetchBriefs(params: {
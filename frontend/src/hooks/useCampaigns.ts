@@ -7,6 +7,8 @@ import {
   deleteCampaign,
   addStoryToCampaign,
   removeStoryFromCampaign,
+  addStoriesToCampaign,
+  removeStoriesFromCampaign,
 } from "@/api/client";
 
 export function useCampaigns(params: {
@@ -114,3 +116,29 @@ export function useRemoveStoryFromCampaign() {
     },
   });
 }
+
+export function useAddStoriesToCampaign() {
+  const qc = useQueryClient();
+  return useMutation({
+    mutationFn: ({ campaignId, storyIds }: { campaignId: string; storyIds: string[] }) =>
+      addStoriesToCampaign(campaignId, storyIds),
+    meta: { successMessage: "Stories added to campaign" },
+    onSuccess: () => {
+      qc.invalidateQueries({ queryKey: ["campaign"] });
+      qc.invalidateQueries({ queryKey: ["campaigns"] });
+    },
+  });
+}
+
+export function useRemoveStoriesFromCampaign() {
+  const qc = useQueryClient();
+  return useMutation({
+    mutationFn: ({ campaignId, storyIds }: { campaignId: string; storyIds: string[] }) =>
+      removeStoriesFromCampaign(campaignId, storyIds),
+    meta: { successMessage: "Stories removed from campaign" },
+    onSuccess: () => {
+      qc.invalidateQueries({ queryKey: ["campaign"] });
+      qc.invalidateQueries({ queryKey: ["campaigns"] });
+    },
+  });
+}
@@ -0,0 +1,6 @@
+-- Migration 007: Sync tokens
+-- Stores a per-platform high-water mark taken from the synced records
+-- themselves, so incremental syncs resume from data time rather than the
+-- wall-clock time the previous run finished.
+
+ALTER TABLE sync_state ADD COLUMN IF NOT EXISTS sync_token TEXT;
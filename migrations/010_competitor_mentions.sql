@@ -0,0 +1,18 @@
+-- Migration 010: Competitor mention search
+-- Trigram index on story text so competitor-name ILIKE scans can use an
+-- index, plus a function that counts mentions server-side.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_extracted_stories_story_text_trgm
+    ON extracted_stories USING gin (story_text gin_trgm_ops);
+
+CREATE OR REPLACE FUNCTION competitor_mentions(p_names TEXT[], p_limit INTEGER DEFAULT 20)
+RETURNS TABLE (competitor TEXT, count BIGINT, story_ids UUID[]) AS $$
+    SELECT n.name, count(s.id), array_agg(s.id)
+    FROM unnest(p_names) WITH ORDINALITY AS n(name, ord)
+    JOIN extracted_stories s ON s.story_text ILIKE '%' || n.name || '%'
+    GROUP BY n.name, n.ord
+    ORDER BY 2 DESC, n.ord
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
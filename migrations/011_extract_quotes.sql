@@ -0,0 +1,43 @@
+-- Migration 011: Customer quote extraction
+-- Pulls quoted passages out of story text with a regex and paginates in the
+-- database, so the API no longer downloads every story_text to scan it.
+-- Postgres caps regex repetition bounds at 255, so the 300-character upper
+-- limit is applied as a length filter instead.
+
+CREATE OR REPLACE FUNCTION extract_quotes(
+    p_theme TEXT DEFAULT NULL,
+    p_company TEXT DEFAULT NULL,
+    p_sentiment TEXT DEFAULT NULL,
+    p_limit INTEGER DEFAULT 50,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    quote TEXT,
+    customer_name TEXT,
+    customer_company TEXT,
+    story_id UUID,
+    story_title TEXT,
+    themes JSONB,
+    sentiment TEXT,
+    total_count BIGINT
+) AS $$
+    SELECT
+        m.match[1],
+        s.customer_name,
+        s.customer_company,
+        s.id,
+        coalesce(s.title, ''),
+        coalesce(s.themes, '[]'::jsonb),
+        s.sentiment,
+        count(*) OVER ()
+    FROM extracted_stories s
+    CROSS JOIN LATERAL regexp_matches(
+        s.story_text, '["“”]([^"“”]{20,})["“”]', 'g'
+    ) WITH ORDINALITY AS m(match, ord)
+    WHERE (p_theme IS NULL OR s.themes @> jsonb_build_array(p_theme))
+        AND (p_company IS NULL OR s.customer_company ILIKE '%' || p_company || '%')
+        AND (p_sentiment IS NULL OR s.sentiment = p_sentiment)
+        AND length(m.match[1]) <= 300
+    ORDER BY s.created_at DESC, s.id, m.ord
+    LIMIT p_limit OFFSET p_offset;
+$$ LANGUAGE sql STABLE;
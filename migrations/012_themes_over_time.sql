@@ -0,0 +1,14 @@
+-- Migration 012: Monthly theme rollup
+-- Theme counts per calendar month for the last N months (including the
+-- current one), aggregated in the database.
+
+CREATE OR REPLACE FUNCTION themes_over_time(p_months INTEGER DEFAULT 12)
+RETURNS TABLE (month TEXT, theme TEXT, count BIGINT) AS $$
+    SELECT to_char(date_trunc('month', s.created_at), 'YYYY-MM'), t.theme, count(*)
+    FROM extracted_stories s,
+        jsonb_array_elements_text(s.themes) AS t(theme)
+    WHERE jsonb_typeof(s.themes) = 'array'
+        AND s.created_at >= date_trunc('month', now()) - make_interval(months => p_months - 1)
+    GROUP BY 1, 2
+    ORDER BY 1, 3 DESC, 2;
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,11 @@
+-- Migration 013: Approximate row counts
+-- Returns the planner's row estimate for a public table from pg_class, an
+-- O(1) catalog lookup instead of a count(*) scan. Returns -1 when the table
+-- has never been vacuumed or analyzed, or NULL for unknown tables.
+
+CREATE OR REPLACE FUNCTION fast_row_count(p_table TEXT)
+RETURNS BIGINT AS $$
+    SELECT c.reltuples::bigint
+    FROM pg_class c
+    WHERE c.oid = to_regclass('public.' || quote_ident(p_table));
+$$ LANGUAGE sql STABLE;
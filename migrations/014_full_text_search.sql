@@ -0,0 +1,29 @@
+-- Migration 014: Full-text search over stories and content
+-- Exposes a `search_tsv` computed field on each table (PostgREST lets
+-- filters reference functions taking the row type) backed by a matching
+-- GIN expression index. Unlike a stored tsvector column it is not returned
+-- by select=*.
+
+CREATE OR REPLACE FUNCTION search_tsv(extracted_stories)
+RETURNS tsvector AS $$
+    SELECT to_tsvector(
+        'english',
+        coalesce($1.title, '') || ' ' || coalesce($1.summary, '') || ' ' || coalesce($1.story_text, '')
+    );
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE INDEX IF NOT EXISTS idx_extracted_stories_search ON extracted_stories USING gin (
+    to_tsvector(
+        'english',
+        coalesce(title, '') || ' ' || coalesce(summary, '') || ' ' || coalesce(story_text, '')
+    )
+);
+
+CREATE OR REPLACE FUNCTION search_tsv(generated_content)
+RETURNS tsvector AS $$
+    SELECT to_tsvector('english', coalesce($1.content, ''));
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE INDEX IF NOT EXISTS idx_generated_content_search ON generated_content USING gin (
+    to_tsvector('english', coalesce(content, ''))
+);
@@ -0,0 +1,32 @@
+-- Migration 015: Recent activity feed
+-- Latest stories and generated content merged in one query for the
+-- dashboard activity feed.
+
+CREATE OR REPLACE FUNCTION recent_activity(p_limit INTEGER DEFAULT 15)
+RETURNS TABLE (
+    source TEXT,
+    id UUID,
+    title TEXT,
+    content_type TEXT,
+    status TEXT,
+    story_id UUID,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT * FROM (
+        (
+            SELECT 'story', s.id, s.title, NULL, NULL, NULL::uuid, s.created_at
+            FROM extracted_stories s
+            ORDER BY s.created_at DESC
+            LIMIT p_limit
+        )
+        UNION ALL
+        (
+            SELECT 'content', c.id, NULL, c.content_type, c.status::text, c.story_id, c.created_at
+            FROM generated_content c
+            ORDER BY c.created_at DESC
+            LIMIT p_limit
+        )
+    ) AS activity
+    ORDER BY 7 DESC
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
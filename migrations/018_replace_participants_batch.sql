@@ -0,0 +1,31 @@
+-- Migration 018: replace_participants_batch()
+-- Replaces the participants of several meetings in a single transaction and
+-- round trip, so a sync batch needs one call instead of one per meeting.
+-- Every listed meeting is cleared; rows carry their own meeting_id.
+
+CREATE OR REPLACE FUNCTION replace_participants_batch(p_meeting_ids UUID[], p_rows JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted INTEGER;
+BEGIN
+    DELETE FROM participants WHERE meeting_id = ANY(p_meeting_ids);
+
+    INSERT INTO participants (
+        meeting_id, name, email, company, role, is_customer, speaker_id, raw_metadata
+    )
+    SELECT
+        r.meeting_id,
+        r.name,
+        r.email,
+        r.company,
+        r.role,
+        coalesce(r.is_customer, false),
+        r.speaker_id,
+        coalesce(r.raw_metadata, '{}'::jsonb)
+    FROM jsonb_populate_recordset(NULL::participants, coalesce(p_rows, '[]'::jsonb)) AS r
+    WHERE r.meeting_id = ANY(p_meeting_ids);
+
+    GET DIAGNOSTICS inserted = ROW_COUNT;
+    RETURN inserted;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,5 @@
+-- Migration 019: Meeting content hashes
+-- Stores a hash of the raw platform payload each meeting was last synced
+-- from, so incremental syncs can skip calls that have not changed.
+
+ALTER TABLE meetings ADD COLUMN IF NOT EXISTS content_hash TEXT;
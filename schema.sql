@@ -1,5 +1,12 @@
 -- Cirrus Ops Database Schema
 -- Apply to Supabase via SQL Editor or psql
+--
+-- Holds the core tables plus the tables created by migrations 002 (mining
+-- profiles) and 006 (sales quotes, orders), but not those migrations' column
+-- changes and nothing from 003-005. On a fresh database, apply this file, then
+-- the ALTER TABLE and index statements of 002, all of 003-005, and 007 onward
+-- from migrations/ (mirrored in supabase/migrations/). 007+ live only there
+-- and are not folded back into this file.
 
 -- Platform enum
 CREATE TYPE platform_type AS ENUM ('gong', 'zoom');
@@ -2,7 +2,7 @@
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from cirrus_ops.api.routers.auth import router as auth_router
@@ -20,7 +20,8 @@ async def lifespan(app: FastAPI):
     from cirrus_ops import db
     db.client()
     yield
-    # Shutdown: nothing to clean up for now
+    # Shutdown: release pooled DB connections
+    db.close_client()
 
 
 app = FastAPI(
@@ -39,6 +40,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def request_cache(request: Request, call_next):
+    """Memoize repeated single-record lookups within one request."""
+    from cirrus_ops import db
+    with db.request_scope():
+        return await call_next(request)
+
+
 app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
 app.include_router(profiles_router, prefix="/api/profiles", tags=["profiles"])
 app.include_router(mining_router, prefix="/api/mining", tags=["mining"])
@@ -54,29 +54,27 @@ def list_meetings(
 @router.get("/meetings/{meeting_id}", response_model=MeetingDetailResponse)
 def get_meeting(meeting_id: str):
     """Get meeting details including participants and transcript info."""
-    meeting = db.get_meeting(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail=f"Meeting not found: {meeting_id}")
-
-    # Get participants
-    participants_result = (
+    # Meeting, participants, transcript info and story count are independent
+    # lookups, so issue them together.
+    meeting, participants_result, transcript, (_, story_count) = db.run_concurrently(
+        lambda: db.get_meeting(meeting_id),
         db.client()
         .table("participants")
         .select("name, email, company, role, is_customer")
         .eq("meeting_id", meeting_id)
-        .execute()
+        .execute,
+        lambda: db.get_transcript(meeting_id, fields="word_count"),
+        lambda: db.list_stories(meeting_id=meeting_id, limit=1, offset=0, fields="id"),
     )
-
-    # Get transcript info
-    transcript = db.get_transcript(meeting_id)
-
-    # Get story count
-    _, story_count = db.list_stories(meeting_id=meeting_id, limit=1, offset=0)
+    if not meeting:
+        raise HTTPException(status_code=404, detail=f"Meeting not found: {meeting_id}")
 
     return MeetingDetailResponse(
         **meeting,
         participants=participants_result.data,
-        has_transcript=transcript is not None and bool(transcript.get("full_text")),
+        # The syncs store word_count 0 for a transcript with no text; a null
+        # count (older rows) doesn't mean the text is missing
+        has_transcript=transcript is not None and transcript.get("word_count") != 0,
         word_count=transcript.get("word_count") if transcript else None,
         story_count=story_count,
     )
@@ -195,8 +193,10 @@ def search(
     offset: int = Query(0, ge=0),
 ):
     """Full-text search across stories and content."""
-    stories, story_total = db.search_stories(q, limit=limit, offset=offset)
-    content, content_total = db.search_content(q, limit=limit, offset=offset)
+    (stories, story_total), (content, content_total) = db.run_concurrently(
+        lambda: db.search_stories(q, limit=limit, offset=offset),
+        lambda: db.search_content(q, limit=limit, offset=offset),
+    )
     return SearchResponse(
         stories=stories,
         content=content,
@@ -240,11 +240,17 @@ def content_pipeline(profile_id: str | None = None):
 @router.get("/analytics/overview")
 def analytics_overview():
     """Overview metrics: total stories, total content, content pipeline."""
+    total_stories, total_content, total_meetings, pipeline = db.run_concurrently(
+        db.count_stories,
+        db.count_content,
+        db.count_meetings,
+        db.get_content_pipeline,
+    )
     return {
-        "total_stories": db.count_stories(),
-        "total_content": db.count_content(),
-        "total_meetings": db.count_meetings(),
-        "pipeline": db.get_content_pipeline(),
+        "total_stories": total_stories,
+        "total_content": total_content,
+        "total_meetings": total_meetings,
+        "pipeline": pipeline,
     }
 
 
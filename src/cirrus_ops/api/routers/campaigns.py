@@ -9,6 +9,7 @@ from cirrus_ops.api.schemas import (
     CampaignCreate,
     CampaignDetailResponse,
     CampaignResponse,
+    CampaignStoriesLink,
     CampaignStoryLink,
     CampaignUpdate,
     ContentResponse,
@@ -122,6 +123,26 @@ def add_story_to_campaign(campaign_id: str, data: CampaignStoryLink):
     return {"status": "linked"}
 
 
+@router.post("/{campaign_id}/stories/bulk", status_code=201)
+def add_stories_to_campaign(campaign_id: str, data: CampaignStoriesLink):
+    """Link several stories to a campaign; already-linked stories are skipped."""
+    campaign = db.get_campaign(campaign_id)
+    if not campaign:
+        raise HTTPException(status_code=404, detail=f"Campaign not found: {campaign_id}")
+    try:
+        linked = db.add_stories_to_campaign(campaign_id, data.story_ids)
+    except Exception:
+        raise HTTPException(status_code=404, detail="One or more stories not found")
+    return {"status": "linked", "linked": len(linked)}
+
+
+@router.delete("/{campaign_id}/stories", status_code=204)
+def remove_stories_from_campaign(campaign_id: str, story_id: list[str] = Query(...)):
+    """Unlink several stories from a campaign (``?story_id=a&story_id=b``)."""
+    db.remove_stories_from_campaign(campaign_id, story_id)
+    return None
+
+
 @router.delete("/{campaign_id}/stories/{story_id}", status_code=204)
 def remove_story_from_campaign(campaign_id: str, story_id: str):
     """Unlink a story from a campaign."""
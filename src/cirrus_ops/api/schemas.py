@@ -395,6 +395,10 @@ class CampaignStoryLink(BaseModel):
     story_id: str
 
 
+class CampaignStoriesLink(BaseModel):
+    story_ids: list[str] = Field(min_length=1)
+
+
 class BriefCreate(BaseModel):
     profile_id: str
     campaign_id: str | None = None
@@ -1,23 +1,77 @@
 import asyncio
 import logging
+import sys
+from collections.abc import Coroutine, Iterable, Sequence
 from datetime import datetime
-import click
+from enum import Enum
+from typing import Any
+
 import typer
 from rich.console import Console
 from rich.table import Table
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-    datefmt="%H:%M:%S",
+# Help text is plain, so skip typer's rich help formatter (and its import).
+app = typer.Typer(
+    name="cirrus",
+    help="Cirrus Ops - Meeting transcript pipeline",
+    rich_markup_mode=None,
 )
-
-app = typer.Typer(name="cirrus", help="Cirrus Ops - Meeting transcript pipeline")
-sync_app = typer.Typer(help="Sync meetings from platforms")
+sync_app = typer.Typer(help="Sync meetings from platforms", rich_markup_mode=None)
 app.add_typer(sync_app, name="sync")
-profiles_app = typer.Typer(help="Manage mining profiles")
+profiles_app = typer.Typer(help="Manage mining profiles", rich_markup_mode=None)
 app.add_typer(profiles_app, name="profiles")
-console = Console()
+console = Console(highlight=False, emoji=False, log_path=False, soft_wrap=True)
+
+_SYNC_STATUS_STYLES = {
+    "idle": "[green]idle[/green]",
+    "running": "[yellow]running[/yellow]",
+    "error": "[red]error[/red]",
+}
+
+
+@app.callback()
+def _main(ctx: typer.Context) -> None:
+    """Configure logging only when a command actually runs.
+
+    Keeps ``--help`` and shell completion as cheap as importing this module.
+    """
+    if ctx.invoked_subcommand:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+            datefmt="%H:%M:%S",
+        )
+
+
+_FULL_SYNC_OPTION = typer.Option(
+    False, "--full", help="Run a full bulk sync instead of incremental"
+)
+
+
+class OutputFormat(str, Enum):
+    table = "table"
+    json = "json"
+
+
+_OUTPUT_OPTION = typer.Option(
+    OutputFormat.table, "--output", "-o", help="Output format: table or json"
+)
+
+
+def _write_json(data: object) -> None:
+    """Write *data* to stdout as indented JSON, bypassing rich entirely."""
+    import orjson
+
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
+    sys.stdout.flush()
+
+
+def _print_tsv(headers: Sequence[str], rows: Iterable[Sequence[str]]) -> None:
+    """Write rows as plain tab-separated values for scripted consumers."""
+    lines = ["\t".join(headers)]
+    for row in rows:
+        lines.append("\t".join(" ".join(str(v).split()) for v in row))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -25,9 +79,22 @@ console = Console()
 # ---------------------------------------------------------------------------
 
 
+def _run_gong(sync: Coroutine[Any, Any, None]) -> None:
+    """Run a Gong sync, closing the shared Gong HTTP pool before the loop ends."""
+    from cirrus_ops.gong import client as gong_client
+
+    async def main() -> None:
+        try:
+            await sync
+        finally:
+            await gong_client.shutdown()
+
+    asyncio.run(main())
+
+
 @sync_app.command("gong")
 def sync_gong(
-    full: bool = typer.Option(False, "--full", help="Run a full bulk sync instead of incremental"),
+    full: bool = _FULL_SYNC_OPTION,
 ) -> None:
     """Sync meetings from Gong."""
     from cirrus_ops.gong.sync import bulk_sync, incremental_sync
@@ -35,10 +102,10 @@ def sync_gong(
     try:
         if full:
             console.print("[bold blue]Starting full Gong sync...[/bold blue]")
-            asyncio.run(bulk_sync())
+            _run_gong(bulk_sync())
         else:
             console.print("[bold blue]Starting incremental Gong sync...[/bold blue]")
-            asyncio.run(incremental_sync())
+            _run_gong(incremental_sync())
         console.print("[green]\u2713[/green] Gong sync complete")
     except Exception:
         console.print("[red]\u2717[/red] Gong sync failed")
@@ -48,7 +115,7 @@ def sync_gong(
 
 @sync_app.command("zoom")
 def sync_zoom(
-    full: bool = typer.Option(False, "--full", help="Run a full bulk sync instead of incremental"),
+    full: bool = _FULL_SYNC_OPTION,
 ) -> None:
     """Sync meetings from Zoom."""
     from cirrus_ops.zoom.sync import bulk_sync, incremental_sync
@@ -69,7 +136,7 @@ def sync_zoom(
 
 @sync_app.command("all")
 def sync_all(
-    full: bool = typer.Option(False, "--full", help="Run a full bulk sync instead of incremental"),
+    full: bool = _FULL_SYNC_OPTION,
 ) -> None:
     """Sync meetings from all platforms."""
     from cirrus_ops.gong.sync import bulk_sync as gong_bulk, incremental_sync as gong_inc
@@ -78,13 +145,13 @@ def sync_all(
     try:
         if full:
             console.print("[bold blue]Starting full sync for all platforms...[/bold blue]")
-            asyncio.run(gong_bulk())
+            _run_gong(gong_bulk())
             console.print("[green]\u2713[/green] Gong sync complete")
             asyncio.run(zoom_bulk())
             console.print("[green]\u2713[/green] Zoom sync complete")
         else:
             console.print("[bold blue]Starting incremental sync for all platforms...[/bold blue]")
-            asyncio.run(gong_inc())
+            _run_gong(gong_inc())
             console.print("[green]\u2713[/green] Gong sync complete")
             asyncio.run(zoom_inc())
             console.print("[green]\u2713[/green] Zoom sync complete")
@@ -101,38 +168,69 @@ def sync_all(
 
 
 @app.command("status")
-def status() -> None:
+def status(output: OutputFormat = _OUTPUT_OPTION) -> None:
     """Show sync status and meeting counts for all platforms."""
     from cirrus_ops import db
 
     try:
+        states = {platform: db.get_sync_state(platform) for platform in ("gong", "zoom")}
+        counts = {platform: db.count_meetings(platform) for platform in ("gong", "zoom")}
+
+        if output is OutputFormat.json:
+            _write_json({"sync_state": states, "meeting_counts": counts})
+            return
+
+        sync_rows: list[tuple[str, str, str, str, str, str]] = []
+        for platform, state in states.items():
+            if state is None:
+                sync_rows.append((platform, "never synced", "-", "-", "0", "-"))
+            else:
+                sync_rows.append(
+                    (
+                        platform,
+                        state.get("status", "unknown"),
+                        str(state.get("last_synced_at") or "-"),
+                        (state.get("sync_token") or "-")[:19],
+                        str(state.get("total_synced", 0)),
+                        state.get("error_message") or "-",
+                    )
+                )
+
+        count_rows = [(platform, str(count)) for platform, count in counts.items()]
+
+        if not console.is_terminal:
+            _print_tsv(
+                (
+                    "platform",
+                    "status",
+                    "last_synced_at",
+                    "sync_token",
+                    "total_synced",
+                    "error_message",
+                ),
+                sync_rows,
+            )
+            sys.stdout.write("\n")
+            _print_tsv(("platform", "meetings"), count_rows)
+            return
+
         table = Table(title="Sync Status")
         table.add_column("Platform", style="cyan")
         table.add_column("Status", style="bold")
         table.add_column("Last Synced At")
+        table.add_column("Sync Token", style="dim")
         table.add_column("Total Synced", justify="right")
         table.add_column("Error Message", style="red")
 
-        for platform in ("gong", "zoom"):
-            state = db.get_sync_state(platform)
-            if state is None:
-                table.add_row(platform, "never synced", "-", "0", "-")
-            else:
-                status_val = state.get("status", "unknown")
-                status_style = {
-                    "idle": "[green]idle[/green]",
-                    "running": "[yellow]running[/yellow]",
-                    "error": "[red]error[/red]",
-                }.get(status_val, status_val)
-
-                last_synced = state.get("last_synced_at") or "-"
-                table.add_row(
-                    platform,
-                    status_style,
-                    str(last_synced),
-                    str(state.get("total_synced", 0)),
-                    state.get("error_message") or "-",
-                )
+        for platform, status_val, last_synced, sync_token, total_synced, error_message in sync_rows:
+            table.add_row(
+                platform,
+                _SYNC_STATUS_STYLES.get(status_val, status_val),
+                last_synced,
+                sync_token,
+                total_synced,
+                error_message,
+            )
 
         console.print(table)
 
@@ -141,9 +239,8 @@ def status() -> None:
         counts_table.add_column("Platform", style="cyan")
         counts_table.add_column("Meetings", justify="right")
 
-        for platform in ("gong", "zoom"):
-            count = db.count_meetings(platform)
-            counts_table.add_row(platform, str(count))
+        for platform, count in count_rows:
+            counts_table.add_row(platform, count)
 
         console.print(counts_table)
     except Exception:
@@ -165,8 +262,13 @@ def mine(
     profile: str = typer.Option("default", "--profile", help="Mining profile to use"),
 ) -> None:
     """Extract customer stories from meeting transcripts."""
-    from cirrus_ops.mining.extractor import extract_stories
+    from cirrus_ops.mining.extractor import (
+        extract_stories,
+        extract_stories_batch,
+        extract_stories_from_row,
+    )
     from cirrus_ops import db
+    from cirrus_ops.config import settings
 
     try:
         if meeting_id:
@@ -176,8 +278,8 @@ def mine(
             )
             stories = extract_stories(meeting_id, profile_name=profile)
             console.print(f"[green]\u2713[/green] Extracted {len(stories)} stories")
-            for story in stories:
-                console.print(f"  - {story['title']}")
+            if stories:
+                console.print("\n".join(f"  - {story['title']}" for story in stories))
         elif batch:
             if not since:
                 console.print("[red]\u2717[/red] --since is required when using --batch")
@@ -187,23 +289,32 @@ def mine(
                 f"[bold blue]Batch mining meetings since {since_date.date()} "
                 f"(profile: {profile})...[/bold blue]"
             )
-            # Fetch meetings since the given date and mine each one
-            result = (
-                db.client()
-                .table("meetings")
-                .select("id")
-                .gte("started_at", since_date.isoformat())
-                .execute()
+            # Meetings arrive with transcript and participants embedded, so
+            # extraction doesn't re-fetch them per meeting.
+            rows = db.iter_meetings_for_mining(
+                since_date.isoformat(), page_size=settings.sync_batch_size
             )
             all_stories = []
-            for row in result.data:
-                mid = row["id"]
-                try:
-                    stories = extract_stories(mid, profile_name=profile)
+            if settings.use_batch_api:
+                stories_by_meeting, skipped = extract_stories_batch(
+                    rows, profile_name=profile, group_size=settings.sync_batch_size
+                )
+                for mid, stories in stories_by_meeting.items():
                     all_stories.extend(stories)
                     console.print(f"  [green]\u2713[/green] Meeting {mid}: {len(stories)} stories")
-                except ValueError as e:
-                    console.print(f"  [yellow]-[/yellow] Meeting {mid}: {e}")
+                for mid, reason in skipped.items():
+                    console.print(f"  [yellow]-[/yellow] Meeting {mid}: {reason}")
+            else:
+                for row in rows:
+                    mid = row["id"]
+                    try:
+                        stories = extract_stories_from_row(row, profile_name=profile)
+                        all_stories.extend(stories)
+                        console.print(
+                            f"  [green]\u2713[/green] Meeting {mid}: {len(stories)} stories"
+                        )
+                    except ValueError as e:
+                        console.print(f"  [yellow]-[/yellow] Meeting {mid}: {e}")
             console.print(f"[green]\u2713[/green] Extracted {len(all_stories)} stories total")
         else:
             console.print("[red]\u2717[/red] Provide --meeting-id or --batch --since")
@@ -250,12 +361,60 @@ def generate(
 
 
 @profiles_app.command("list")
-def profiles_list() -> None:
+def profiles_list(output: OutputFormat = _OUTPUT_OPTION) -> None:
     """List all mining profiles."""
     from cirrus_ops import db
 
     try:
         profiles = db.list_profiles()
+        rows: list[tuple[str, str, str, str, str, str, bool]] = []
+        records: list[dict[str, object]] = []
+        for p in profiles:
+            content_types = db.get_profile_content_types(p["id"])
+            knowledge = db.get_profile_knowledge(p["id"])
+            themes = p.get("themes", [])
+            records.append(
+                {
+                    "name": p["name"],
+                    "display_name": p["display_name"],
+                    "description": p.get("description"),
+                    "themes": len(themes),
+                    "content_types": len(content_types),
+                    "knowledge_docs": len(knowledge),
+                    "active": bool(p.get("is_active")),
+                }
+            )
+            rows.append(
+                (
+                    p["name"],
+                    p["display_name"],
+                    (p.get("description") or "")[:60],
+                    str(len(themes)),
+                    str(len(content_types)),
+                    str(len(knowledge)),
+                    bool(p.get("is_active")),
+                )
+            )
+
+        if output is OutputFormat.json:
+            _write_json(records)
+            return
+
+        if not console.is_terminal:
+            _print_tsv(
+                (
+                    "name",
+                    "display_name",
+                    "description",
+                    "themes",
+                    "content_types",
+                    "knowledge_docs",
+                    "active",
+                ),
+                [(*row[:-1], "yes" if row[-1] else "no") for row in rows],
+            )
+            return
+
         table = Table(title="Mining Profiles")
         table.add_column("Name", style="cyan")
         table.add_column("Display Name", style="bold")
@@ -265,20 +424,8 @@ def profiles_list() -> None:
         table.add_column("Knowledge Docs", justify="right")
         table.add_column("Active")
 
-        for p in profiles:
-            content_types = db.get_profile_content_types(p["id"])
-            knowledge = db.get_profile_knowledge(p["id"])
-            themes = p.get("themes", [])
-
-            table.add_row(
-                p["name"],
-                p["display_name"],
-                (p.get("description") or "")[:60],
-                str(len(themes)),
-                str(len(content_types)),
-                str(len(knowledge)),
-                "[green]yes[/green]" if p.get("is_active") else "[red]no[/red]",
-            )
+        for *cells, active in rows:
+            table.add_row(*cells, "[green]yes[/green]" if active else "[red]no[/red]")
 
         console.print(table)
     except Exception:
@@ -290,6 +437,7 @@ def profiles_list() -> None:
 @profiles_app.command("show")
 def profiles_show(
     name: str = typer.Argument(..., help="Profile name to show"),
+    output: OutputFormat = _OUTPUT_OPTION,
 ) -> None:
     """Show details of a mining profile."""
     from cirrus_ops import db
@@ -300,6 +448,13 @@ def profiles_show(
             console.print(f"[red]\u2717[/red] Profile not found: {name}")
             raise typer.Exit(code=1)
 
+        content_types = db.get_profile_content_types(profile["id"])
+        knowledge = db.get_profile_knowledge(profile["id"])
+
+        if output is OutputFormat.json:
+            _write_json({**profile, "content_types": content_types, "knowledge": knowledge})
+            return
+
         console.print(f"\n[bold cyan]{profile['display_name']}[/bold cyan] ({profile['name']})")
         console.print(f"  Description: {profile.get('description', '-')}")
         console.print(f"  Confidence threshold: {profile.get('confidence_threshold', 0.5)}")
@@ -307,23 +462,27 @@ def profiles_show(
 
         themes = profile.get("themes", [])
         console.print(f"\n  [bold]Themes[/bold] ({len(themes)}):")
-        for t in themes:
-            console.print(f"    - {t}")
+        if themes:
+            console.print("\n".join(f"    - {t}" for t in themes))
 
-        content_types = db.get_profile_content_types(profile["id"])
         console.print(f"\n  [bold]Content Types[/bold] ({len(content_types)}):")
-        for ct in content_types:
+        if content_types:
             console.print(
-                f"    - {ct['name']} ({ct['display_name']}) "
-                f"[dim]max_tokens={ct.get('max_tokens', 4096)}[/dim]"
+                "\n".join(
+                    f"    - {ct['name']} ({ct['display_name']}) "
+                    f"[dim]max_tokens={ct.get('max_tokens', 4096)}[/dim]"
+                    for ct in content_types
+                )
             )
 
-        knowledge = db.get_profile_knowledge(profile["id"])
         console.print(f"\n  [bold]Knowledge Documents[/bold] ({len(knowledge)}):")
-        for k in knowledge:
+        if knowledge:
             console.print(
-                f"    - {k['name']} ({k['display_name']}) "
-                f"[dim]usage={k['usage']}, {len(k['content'])} chars[/dim]"
+                "\n".join(
+                    f"    - {k['name']} ({k['display_name']}) "
+                    f"[dim]usage={k['usage']}, {len(k['content'])} chars[/dim]"
+                    for k in knowledge
+                )
             )
 
         console.print()
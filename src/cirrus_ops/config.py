@@ -16,19 +16,27 @@ class Settings(BaseSettings):
     gong_access_key: str = ""
     gong_access_key_secret: str = ""
     gong_base_url: str = "https://us-11211.api.gong.io"
+    gong_rps: float = 3.0  # Gong's default API quota is 3 requests/second
 
     # Zoom
     zoom_account_id: str = ""
     zoom_client_id: str = ""
     zoom_client_secret: str = ""
+    zoom_token_cache_path: str = ""  # opt-in; e.g. ~/.cache/cirrus-ops/zoom_token.json
 
     # Anthropic
     anthropic_api_key: str = ""
     claude_model: str = "claude-sonnet-4-6"
+    use_batch_api: bool = False  # used by `mine --batch` only
+    claude_batch_poll_seconds: float = 10.0
+    claude_batch_max_wait_seconds: float = 3600.0
+    claude_concurrency: int = 5
 
     # Sync settings
     sync_batch_size: int = 50
     sync_concurrency: int = 5
+    sync_max_inflight: int = 2  # batches processed concurrently per sync
+    gong_user_cache_ttl: int = 900  # seconds
 
 
 settings = Settings()
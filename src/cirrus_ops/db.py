@@ -2,34 +2,211 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import copy
+import functools
 import json
 import re
-import uuid
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from io import BufferedReader
+from typing import Any, TypeVar
 
-from supabase import create_client, Client
+import httpx
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from postgrest.exceptions import APIError
+from postgrest.types import ReturnMethod
+from supabase import ClientOptions, create_client, Client
 
 from cirrus_ops.config import settings
 
 
-def get_client() -> Client:
-    """Create and return a Supabase client."""
-    return create_client(settings.supabase_url, settings.supabase_key)
+def get_client(http_client: httpx.Client | None = None) -> Client:
+    """Create and return a Supabase client.
 
+    When *http_client* is given, PostgREST, storage and auth all send their
+    requests through it instead of each opening their own connections.
+    """
+    options = ClientOptions(httpx_client=http_client) if http_client is not None else None
+    return create_client(settings.supabase_url, settings.supabase_key, options=options)
+
+
+def _build_http_client() -> httpx.Client:
+    """Build the pooled keep-alive HTTP client shared by the Supabase client.
 
-# Singleton client
+    The transport retries failed connection attempts (never a request that
+    reached the server), so a dropped pooled connection or a blip while
+    reconnecting doesn't fail the query.
+    """
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        retries=2,
+    )
+    return httpx.Client(
+        transport=transport,
+        timeout=httpx.Timeout(120.0, connect=10.0),
+        follow_redirects=True,
+    )
+
+
+# Singleton client, shared across threads (FastAPI runs sync endpoints in a
+# thread pool), so construction is guarded by a lock.
 _client: Client | None = None
+_http_client: httpx.Client | None = None
+_client_lock = threading.Lock()
 
 
 def client() -> Client:
     """Return the singleton Supabase client."""
-    global _client
+    global _client, _http_client
     if _client is None:
-        _client = get_client()
+        with _client_lock:
+            if _client is None:
+                _http_client = _build_http_client()
+                _client = get_client(_http_client)
     return _client
 
 
+def close_client() -> None:
+    """Close the singleton client's HTTP connections, e.g. on shutdown."""
+    global _client, _http_client
+    with _client_lock:
+        if _http_client is not None:
+            _http_client.close()
+        _client = None
+        _http_client = None
+
+
+# Worker threads for fanning out independent queries. The pooled HTTP client
+# is thread-safe, so concurrent queries share its keep-alive connections.
+_query_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cirrus-db")
+
+
+def run_concurrently(*calls: Callable[[], Any]) -> list[Any]:
+    """Run independent blocking queries in parallel; results keep call order.
+
+    Each call runs in a copy of the caller's context, so context variables
+    set by the caller stay visible inside it.
+    """
+    if len(calls) < 2:
+        return [call() for call in calls]
+    futures = [_query_pool.submit(contextvars.copy_context().run, call) for call in calls]
+    return [future.result() for future in futures]
+
+
+def _rpc(function: str, params: dict[str, Any] | None = None) -> Any | None:
+    """Call a Postgres function, returning ``None`` if it is not deployed.
+
+    Callers fall back to the equivalent client-side queries on ``None`` so the
+    code keeps working against a database that predates the migration.
+    """
+    try:
+        return client().rpc(function, params or {}).execute().data
+    except APIError as exc:
+        if exc.code == "PGRST202":  # function not found in the schema cache
+            return None
+        raise
+
+
+def _one(query: Any) -> dict[str, Any] | None:
+    """Execute a filtered select for at most one row; ``None`` if no match.
+
+    ``limit(1)`` lets Postgres stop at the first match.
+    """
+    result = query.limit(1).maybe_single().execute()
+    return result.data if result is not None else None
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Per-request memo for single-row getters. The API opens a scope around each
+# request so repeat lookups of the same record (e.g. an existence check, then
+# the render) hit a dict instead of the database; outside a scope (CLI,
+# sync jobs) nothing is cached. Writes to a memoized table drop the memo.
+_request_cache: contextvars.ContextVar[dict[Any, Any] | None] = contextvars.ContextVar(
+    "request_cache", default=None
+)
+
+
+@contextlib.contextmanager
+def request_scope() -> Iterator[None]:
+    """Memoize single-row getters for the duration of the ``with`` block."""
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+def _request_memoized(fn: _F) -> _F:
+    """Memoize a getter within the current request scope, returning private copies.
+
+    ``None`` results are not memoized, so a record created later in the same
+    request is still found.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cache = _request_cache.get()
+        if cache is None:
+            return fn(*args, **kwargs)
+        key = hashkey(fn.__name__, *args, **kwargs)
+        value = cache.get(key)
+        if value is None:
+            value = fn(*args, **kwargs)
+            if value is None:
+                return None
+            cache[key] = value
+        return copy.deepcopy(value)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _forget_request_cache() -> None:
+    """Drop the current request's memoized rows after a write."""
+    cache = _request_cache.get()
+    if cache is not None:
+        cache.clear()
+
+
+# Dashboard row counts are cached briefly; unfiltered counts of large tables
+# use the planner's estimate instead of an exact count(*) scan. Below this
+# size the estimate may lag far behind (e.g. before the first ANALYZE) and
+# an exact count is cheap anyway.
+_count_cache: TTLCache = TTLCache(maxsize=16, ttl=30)
+_count_cache_lock = threading.Lock()
+_EXACT_COUNT_BELOW = 10_000
+
+
+def _row_count(table: str, **filters: Any) -> int:
+    """Count rows in *table* matching equality *filters*, cached for 30s."""
+    key = (table, *sorted(filters.items()))
+    with _count_cache_lock:
+        count = _count_cache.get(key)
+    if count is not None:
+        return count
+
+    if not filters:
+        estimate = _rpc("fast_row_count", {"p_table": table})
+        if estimate is not None and estimate >= _EXACT_COUNT_BELOW:
+            count = estimate
+    if count is None:
+        query = client().table(table).select("id", count="exact", head=True)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        count = query.execute().count or 0
+
+    with _count_cache_lock:
+        _count_cache[key] = count
+    return count
+
+
 # -- Meeting operations --
 
 
@@ -41,72 +218,209 @@ def upsert_meeting(data: dict[str, Any]) -> dict[str, Any]:
         .upsert(data, on_conflict="platform,external_id")
         .execute()
     )
+    _forget_request_cache()
     return result.data[0]
 
 
+def upsert_meetings(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Upsert a batch of meeting records in one request. Returns the upserted rows."""
+    if not rows:
+        return []
+    result = (
+        client()
+        .table("meetings")
+        .upsert(rows, on_conflict="platform,external_id")
+        .execute()
+    )
+    _forget_request_cache()
+    return result.data
+
+
+@_request_memoized
 def get_meeting(meeting_id: str) -> dict[str, Any] | None:
     """Fetch a single meeting by ID."""
-    result = client().table("meetings").select("*").eq("id", meeting_id).execute()
-    return result.data[0] if result.data else None
+    return _one(client().table("meetings").select("*").eq("id", meeting_id))
 
 
 def get_meeting_by_external(platform: str, external_id: str) -> dict[str, Any] | None:
     """Fetch a meeting by platform + external_id."""
-    result = (
+    return _one(
         client()
         .table("meetings")
         .select("*")
         .eq("platform", platform)
         .eq("external_id", external_id)
+    )
+
+
+def get_synced_meeting_hashes(platform: str, external_ids: list[str]) -> dict[str, str]:
+    """Map external ID -> ``content_hash`` for meetings already fully synced.
+
+    Only meetings that have a transcript count, so a call whose transcript
+    was missing or failed last time is picked up again.
+    """
+    if not external_ids:
+        return {}
+    result = (
+        client()
+        .table("meetings")
+        .select("external_id, content_hash, transcripts!inner(id)")
+        .eq("platform", platform)
+        .in_("external_id", external_ids)
         .execute()
     )
-    return result.data[0] if result.data else None
+    return {row["external_id"]: row["content_hash"] for row in result.data if row["content_hash"]}
 
 
 def count_meetings(platform: str | None = None) -> int:
     """Count meetings, optionally filtered by platform."""
-    query = client().table("meetings").select("id", count="exact")
     if platform:
-        query = query.eq("platform", platform)
-    result = query.execute()
-    return result.count or 0
+        return _row_count("meetings", platform=platform)
+    return _row_count("meetings")
 
 
 # -- Participant operations --
 
 
 def upsert_participants(meeting_id: str, participants: list[dict[str, Any]]) -> None:
-    """Delete existing participants for a meeting and insert new ones."""
-    client().table("participants").delete().eq("meeting_id", meeting_id).execute()
+    """Replace a meeting's participants.
+
+    Uses the ``replace_participants`` function to delete and insert in one
+    transaction and round trip; ids come from the column default.
+    """
+    params = {"p_meeting_id": meeting_id, "p_rows": participants}
+    if _rpc("replace_participants", params) is not None:
+        return
+    (
+        client()
+        .table("participants")
+        .delete(returning=ReturnMethod.minimal)
+        .eq("meeting_id", meeting_id)
+        .execute()
+    )
     if participants:
-        rows = [{**p, "meeting_id": meeting_id, "id": str(uuid.uuid4())} for p in participants]
-        client().table("participants").insert(rows).execute()
+        rows = [{**p, "meeting_id": meeting_id} for p in participants]
+        client().table("participants").insert(rows, returning=ReturnMethod.minimal).execute()
+
+
+def replace_participants_batch(participants_by_meeting: dict[str, list[dict[str, Any]]]) -> None:
+    """Replace the participants of several meetings at once.
+
+    Uses the ``replace_participants_batch`` function to clear and refill every
+    listed meeting in one transaction and round trip.
+    """
+    if not participants_by_meeting:
+        return
+    meeting_ids = list(participants_by_meeting)
+    rows = [
+        {**p, "meeting_id": meeting_id}
+        for meeting_id, participants in participants_by_meeting.items()
+        for p in participants
+    ]
+    params = {"p_meeting_ids": meeting_ids, "p_rows": rows}
+    if _rpc("replace_participants_batch", params) is not None:
+        return
+    (
+        client()
+        .table("participants")
+        .delete(returning=ReturnMethod.minimal)
+        .in_("meeting_id", meeting_ids)
+        .execute()
+    )
+    if rows:
+        client().table("participants").insert(rows, returning=ReturnMethod.minimal).execute()
 
 
 # -- Transcript operations --
 
 
-def upsert_transcript(data: dict[str, Any]) -> dict[str, Any]:
-    """Upsert a transcript record (one per meeting)."""
-    result = (
+def upsert_transcript(data: dict[str, Any]) -> None:
+    """Upsert a transcript record (one per meeting).
+
+    The row isn't echoed back (``return=minimal``); transcripts can run to
+    megabytes and no caller needs them.
+    """
+    (
         client()
         .table("transcripts")
-        .upsert(data, on_conflict="meeting_id")
+        .upsert(data, on_conflict="meeting_id", returning=ReturnMethod.minimal)
         .execute()
     )
-    return result.data[0]
 
 
-def get_transcript(meeting_id: str) -> dict[str, Any] | None:
-    """Fetch the transcript for a meeting."""
-    result = (
+def upsert_transcripts(rows: list[dict[str, Any]]) -> None:
+    """Upsert a batch of transcript records (one per meeting) in one request."""
+    if not rows:
+        return
+    (
         client()
         .table("transcripts")
-        .select("*")
+        .upsert(rows, on_conflict="meeting_id", returning=ReturnMethod.minimal)
+        .execute()
+    )
+
+
+def set_transcript_word_count(meeting_id: str, word_count: int) -> None:
+    """Store a computed word count on a meeting's transcript."""
+    (
+        client()
+        .table("transcripts")
+        .update({"word_count": word_count}, returning=ReturnMethod.minimal)
         .eq("meeting_id", meeting_id)
         .execute()
     )
-    return result.data[0] if result.data else None
+
+
+def get_transcript(meeting_id: str, fields: str = "*") -> dict[str, Any] | None:
+    """Fetch the transcript for a meeting.
+
+    Pass a narrower *fields* list when the text and segments (often
+    megabytes) aren't needed.
+    """
+    return _one(
+        client()
+        .table("transcripts")
+        .select(fields)
+        .eq("meeting_id", meeting_id)
+    )
+
+
+# -- Mining queries --
+
+# Everything story extraction needs, fetched in one round trip via embedded
+# resources instead of separate meeting/transcript/participant lookups.
+MINING_MEETING_FIELDS = (
+    "id, title, started_at, transcripts(full_text, word_count), participants(name, email)"
+)
+
+
+def get_meeting_for_mining(meeting_id: str) -> dict[str, Any] | None:
+    """Fetch a meeting with its transcript and participants embedded."""
+    return _one(client().table("meetings").select(MINING_MEETING_FIELDS).eq("id", meeting_id))
+
+
+def iter_meetings_for_mining(since: str, page_size: int = 50) -> Iterator[dict[str, Any]]:
+    """Yield meetings started on/after ``since`` with transcript and participants embedded.
+
+    Pages through the results so a large batch never holds every transcript
+    in memory at once.
+    """
+    offset = 0
+    while True:
+        result = (
+            client()
+            .table("meetings")
+            .select(MINING_MEETING_FIELDS)
+            .gte("started_at", since)
+            .order("started_at")
+            .order("id")
+            .range(offset, offset + page_size - 1)
+            .execute()
+        )
+        yield from result.data
+        if len(result.data) < page_size:
+            return
+        offset += page_size
 
 
 # -- Media operations --
@@ -118,9 +432,15 @@ def insert_media(data: dict[str, Any]) -> dict[str, Any]:
     return result.data[0]
 
 
-def upload_to_storage(bucket: str, path: str, file_bytes: bytes, content_type: str) -> str:
-    """Upload a file to Supabase Storage. Returns the storage path."""
-    client().storage.from_(bucket).upload(path, file_bytes, {"content-type": content_type})
+def upload_to_storage(
+    bucket: str, path: str, file: bytes | BufferedReader, content_type: str
+) -> str:
+    """Upload a file to Supabase Storage. Returns the storage path.
+
+    *file* may be an open binary file, which is streamed rather than read
+    into memory.
+    """
+    client().storage.from_(bucket).upload(path, file, {"content-type": content_type})
     return path
 
 
@@ -129,19 +449,23 @@ def upload_to_storage(bucket: str, path: str, file_bytes: bytes, content_type: s
 
 def get_sync_state(platform: str) -> dict[str, Any] | None:
     """Get the current sync state for a platform."""
-    result = (
+    return _one(
         client()
         .table("sync_state")
         .select("*")
         .eq("platform", platform)
-        .execute()
     )
-    return result.data[0] if result.data else None
 
 
 def update_sync_state(platform: str, **kwargs: Any) -> None:
     """Update sync state fields for a platform."""
-    client().table("sync_state").update(kwargs).eq("platform", platform).execute()
+    (
+        client()
+        .table("sync_state")
+        .update(kwargs, returning=ReturnMethod.minimal)
+        .eq("platform", platform)
+        .execute()
+    )
 
 
 def set_sync_running(platform: str) -> None:
@@ -149,15 +473,28 @@ def set_sync_running(platform: str) -> None:
     update_sync_state(platform, status="running", error_message=None)
 
 
-def set_sync_complete(platform: str, total_synced: int, last_cursor: str | None = None) -> None:
-    """Mark a sync as complete."""
-    update_sync_state(
-        platform,
-        status="idle",
-        last_synced_at=datetime.utcnow().isoformat(),
-        total_synced=total_synced,
-        last_cursor=last_cursor,
-    )
+def set_sync_complete(
+    platform: str,
+    total_synced: int,
+    last_cursor: str | None = None,
+    sync_token: str | None = None,
+) -> None:
+    """Mark a sync as complete.
+
+    ``sync_token`` is the platform-side high-water mark reached by this run;
+    it is only written when given so an empty run keeps the previous token.
+    ``last_synced_at`` is sent as Postgres's ``'now'`` input literal, so the
+    database stamps it with its own clock rather than ours.
+    """
+    fields: dict[str, Any] = {
+        "status": "idle",
+        "last_synced_at": "now",
+        "total_synced": total_synced,
+        "last_cursor": last_cursor,
+    }
+    if sync_token is not None:
+        fields["sync_token"] = sync_token
+    update_sync_state(platform, **fields)
 
 
 def set_sync_error(platform: str, error_message: str) -> None:
@@ -174,6 +511,14 @@ def insert_story(data: dict[str, Any]) -> dict[str, Any]:
     return result.data[0]
 
 
+def insert_stories(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Insert a batch of extracted stories in one request."""
+    if not rows:
+        return []
+    result = client().table("extracted_stories").insert(rows).execute()
+    return result.data
+
+
 def get_stories(meeting_id: str | None = None) -> list[dict[str, Any]]:
     """Fetch extracted stories, optionally filtered by meeting."""
     query = client().table("extracted_stories").select("*")
@@ -183,10 +528,10 @@ def get_stories(meeting_id: str | None = None) -> list[dict[str, Any]]:
     return result.data
 
 
+@_request_memoized
 def get_story(story_id: str) -> dict[str, Any] | None:
     """Fetch a single story by ID."""
-    result = client().table("extracted_stories").select("*").eq("id", story_id).execute()
-    return result.data[0] if result.data else None
+    return _one(client().table("extracted_stories").select("*").eq("id", story_id))
 
 
 def insert_content(data: dict[str, Any]) -> dict[str, Any]:
@@ -210,17 +555,49 @@ def get_content_for_story(story_id: str) -> list[dict[str, Any]]:
 
 # -- Profile operations --
 
+# Profiles, their content types and knowledge docs are read on nearly every
+# API request and mining run but change rarely, so reads are memoized for a
+# short TTL. Every write to those tables clears the cache; other processes
+# see changes once their entries expire.
+_profile_cache: TTLCache = TTLCache(maxsize=512, ttl=60)
+_profile_cache_lock = threading.RLock()
+
+
+def _profile_cached(fn: _F) -> _F:
+    """Memoize a profile read in ``_profile_cache``, returning private copies.
+
+    Callers routinely decorate the returned dicts (e.g. attaching
+    ``content_types``), so each call gets a deep copy of the cached value.
+    """
+    memoized = cached(
+        _profile_cache,
+        key=functools.partial(hashkey, fn.__name__),
+        lock=_profile_cache_lock,
+    )(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return copy.deepcopy(memoized(*args, **kwargs))
+
+    return wrapper  # type: ignore[return-value]
+
+
+def invalidate_profile_cache() -> None:
+    """Drop all memoized profile, content type and knowledge reads."""
+    with _profile_cache_lock:
+        _profile_cache.clear()
+
 
+@_profile_cached
 def get_profile(name: str) -> dict[str, Any] | None:
     """Fetch a mining profile by name."""
-    result = client().table("mining_profiles").select("*").eq("name", name).execute()
-    return result.data[0] if result.data else None
+    return _one(client().table("mining_profiles").select("*").eq("name", name))
 
 
+@_profile_cached
 def get_profile_by_id(profile_id: str) -> dict[str, Any] | None:
     """Fetch a mining profile by ID."""
-    result = client().table("mining_profiles").select("*").eq("id", profile_id).execute()
-    return result.data[0] if result.data else None
+    return _one(client().table("mining_profiles").select("*").eq("id", profile_id))
 
 
 def list_profiles() -> list[dict[str, Any]]:
@@ -238,6 +615,7 @@ def list_profiles() -> list[dict[str, Any]]:
 def create_profile(data: dict[str, Any]) -> dict[str, Any]:
     """Create a new mining profile."""
     result = client().table("mining_profiles").insert(data).execute()
+    invalidate_profile_cache()
     return result.data[0]
 
 
@@ -250,17 +628,20 @@ def update_profile(profile_id: str, data: dict[str, Any]) -> dict[str, Any]:
         .eq("id", profile_id)
         .execute()
     )
+    invalidate_profile_cache()
     return result.data[0]
 
 
 def delete_profile(profile_id: str) -> None:
     """Delete a mining profile."""
     client().table("mining_profiles").delete().eq("id", profile_id).execute()
+    invalidate_profile_cache()
 
 
 # -- Profile content type operations --
 
 
+@_profile_cached
 def get_profile_content_types(profile_id: str) -> list[dict[str, Any]]:
     """Fetch all content types for a profile."""
     result = (
@@ -274,22 +655,22 @@ def get_profile_content_types(profile_id: str) -> list[dict[str, Any]]:
     return result.data
 
 
+@_profile_cached
 def get_profile_content_type(profile_id: str, name: str) -> dict[str, Any] | None:
     """Fetch a single content type by profile_id and name."""
-    result = (
+    return _one(
         client()
         .table("profile_content_types")
         .select("*")
         .eq("profile_id", profile_id)
         .eq("name", name)
-        .execute()
     )
-    return result.data[0] if result.data else None
 
 
 def create_profile_content_type(data: dict[str, Any]) -> dict[str, Any]:
     """Create a content type for a profile."""
     result = client().table("profile_content_types").insert(data).execute()
+    invalidate_profile_cache()
     return result.data[0]
 
 
@@ -302,17 +683,20 @@ def update_profile_content_type(ct_id: str, data: dict[str, Any]) -> dict[str, A
         .eq("id", ct_id)
         .execute()
     )
+    invalidate_profile_cache()
     return result.data[0]
 
 
 def delete_profile_content_type(ct_id: str) -> None:
     """Delete a profile content type."""
     client().table("profile_content_types").delete().eq("id", ct_id).execute()
+    invalidate_profile_cache()
 
 
 # -- Profile knowledge operations --
 
 
+@_profile_cached
 def get_profile_knowledge(
     profile_id: str, usage: str | None = None
 ) -> list[dict[str, Any]]:
@@ -337,6 +721,7 @@ def get_profile_knowledge(
 def create_profile_knowledge(data: dict[str, Any]) -> dict[str, Any]:
     """Create a knowledge doc for a profile."""
     result = client().table("profile_knowledge").insert(data).execute()
+    invalidate_profile_cache()
     return result.data[0]
 
 
@@ -349,16 +734,41 @@ def update_profile_knowledge(knowledge_id: str, data: dict[str, Any]) -> dict[st
         .eq("id", knowledge_id)
         .execute()
     )
+    invalidate_profile_cache()
     return result.data[0]
 
 
 def delete_profile_knowledge(knowledge_id: str) -> None:
     """Delete a profile knowledge doc."""
     client().table("profile_knowledge").delete().eq("id", knowledge_id).execute()
+    invalidate_profile_cache()
 
 
 # -- Filtered queries for browse API --
 
+# List views only render these columns; skipping raw_metadata/raw_analysis
+# JSON and full story_text keeps paginated responses small. Detail getters
+# still select "*".
+MEETING_LIST_FIELDS = (
+    "id, platform, external_id, title, started_at, ended_at, duration_seconds, "
+    "host_name, host_email, created_at"
+)
+STORY_LIST_FIELDS = (
+    "id, meeting_id, profile_id, title, summary, themes, customer_name, "
+    "customer_company, sentiment, confidence_score, personas, funnel_stage, created_at"
+)
+
+# Embedding the junction table with !inner turns a campaign filter into a
+# join, instead of fetching story ids first and sending them back as IN (...).
+_CAMPAIGN_LINK_EMBED = "campaign_stories!inner(campaign_id)"
+
+
+def _strip_campaign_link(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop the embedded junction column so rows keep the plain story shape."""
+    for row in rows:
+        row.pop("campaign_stories", None)
+    return rows
+
 
 def list_meetings(
     platform: str | None = None,
@@ -366,9 +776,10 @@ def list_meetings(
     until: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    fields: str = MEETING_LIST_FIELDS,
 ) -> tuple[list[dict[str, Any]], int]:
     """List meetings with optional filters and pagination. Returns (rows, total_count)."""
-    query = client().table("meetings").select("*", count="exact")
+    query = client().table("meetings").select(fields, count="exact")
     if platform:
         query = query.eq("platform", platform)
     if since:
@@ -390,9 +801,20 @@ def list_stories(
     campaign_id: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    fields: str = STORY_LIST_FIELDS,
 ) -> tuple[list[dict[str, Any]], int]:
     """List stories with optional filters. Returns (rows, total_count)."""
-    query = client().table("extracted_stories").select("*", count="exact")
+    if campaign_id:
+        # Inner-join the junction table so only stories linked to the
+        # campaign come back, in the same request.
+        query = (
+            client()
+            .table("extracted_stories")
+            .select(f"{fields}, {_CAMPAIGN_LINK_EMBED}", count="exact")
+            .eq("campaign_stories.campaign_id", campaign_id)
+        )
+    else:
+        query = client().table("extracted_stories").select(fields, count="exact")
     if meeting_id:
         query = query.eq("meeting_id", meeting_id)
     if profile_id:
@@ -407,21 +829,8 @@ def list_stories(
         query = query.filter("personas", "cs", json.dumps([persona]))
     if funnel_stage:
         query = query.eq("funnel_stage", funnel_stage)
-    if campaign_id:
-        # Filter to stories linked to this campaign via junction table
-        junction = (
-            client()
-            .table("campaign_stories")
-            .select("story_id")
-            .eq("campaign_id", campaign_id)
-            .execute()
-        )
-        story_ids = [r["story_id"] for r in junction.data]
-        if not story_ids:
-            return [], 0
-        query = query.in_("id", story_ids)
     result = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
-    return result.data, result.count or 0
+    return _strip_campaign_link(result.data), result.count or 0
 
 
 def list_content(
@@ -455,10 +864,10 @@ def list_content(
 # -- Content Studio operations --
 
 
+@_request_memoized
 def get_content(content_id: str) -> dict[str, Any] | None:
     """Fetch a single content record by ID."""
-    result = client().table("generated_content").select("*").eq("id", content_id).execute()
-    return result.data[0] if result.data else None
+    return _one(client().table("generated_content").select("*").eq("id", content_id))
 
 
 def update_content(content_id: str, data: dict[str, Any]) -> dict[str, Any]:
@@ -470,6 +879,7 @@ def update_content(content_id: str, data: dict[str, Any]) -> dict[str, Any]:
         .eq("id", content_id)
         .execute()
     )
+    _forget_request_cache()
     return result.data[0]
 
 
@@ -487,53 +897,86 @@ def get_content_versions(story_id: str, content_type: str) -> list[dict[str, Any
     return result.data
 
 
+def _search(
+    table: str, query: str, ilike_fallback: str, limit: int, offset: int
+) -> tuple[list[dict[str, Any]], int]:
+    """Full-text search *table* via its indexed ``search_tsv`` computed field.
+
+    Falls back to the *ilike_fallback* ``or`` filter when the field does not
+    exist yet (database predates the full-text search migration).
+    """
+
+    def run(apply: Callable[[Any], Any]) -> Any:
+        builder = apply(client().table(table).select("*", count="exact"))
+        return builder.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+
+    try:
+        result = run(lambda q: q.filter("search_tsv", "wfts(english)", query))
+    except APIError as exc:
+        if exc.code != "42703":  # undefined column
+            raise
+        result = run(lambda q: q.or_(ilike_fallback))
+    return result.data, result.count or 0
+
+
 def search_stories(query: str, limit: int = 20, offset: int = 0) -> tuple[list[dict[str, Any]], int]:
-    """Search stories by title, summary, or story_text using ilike."""
+    """Search stories by title, summary, or story_text (web-search syntax)."""
     pattern = f"%{query}%"
-    result = (
-        client()
-        .table("extracted_stories")
-        .select("*", count="exact")
-        .or_(f"title.ilike.{pattern},summary.ilike.{pattern},story_text.ilike.{pattern}")
-        .order("created_at", desc=True)
-        .range(offset, offset + limit - 1)
-        .execute()
+    return _search(
+        "extracted_stories",
+        query,
+        f"title.ilike.{pattern},summary.ilike.{pattern},story_text.ilike.{pattern}",
+        limit,
+        offset,
     )
-    return result.data, result.count or 0
 
 
 def search_content(query: str, limit: int = 20, offset: int = 0) -> tuple[list[dict[str, Any]], int]:
-    """Search generated content by content text using ilike."""
-    pattern = f"%{query}%"
-    result = (
-        client()
-        .table("generated_content")
-        .select("*", count="exact")
-        .ilike("content", pattern)
-        .order("created_at", desc=True)
-        .range(offset, offset + limit - 1)
-        .execute()
-    )
-    return result.data, result.count or 0
+    """Search generated content by content text (web-search syntax)."""
+    return _search("generated_content", query, f"content.ilike.%{query}%", limit, offset)
+
+
+def _iter_rows(table: str, columns: str, page_size: int = 1000) -> Iterator[dict[str, Any]]:
+    """Yield every row of ``table`` a page at a time, ordered by id.
+
+    PostgREST caps each response at its ``max-rows`` setting, so a single
+    unbounded select silently truncates large tables; paging with ``range``
+    reads them in full without building one giant response.
+    """
+    offset = 0
+    while True:
+        result = (
+            client()
+            .table(table)
+            .select(columns)
+            .order("id")
+            .range(offset, offset + page_size - 1)
+            .execute()
+        )
+        yield from result.data
+        if len(result.data) < page_size:
+            return
+        offset += page_size
 
 
 def get_theme_counts() -> list[dict[str, Any]]:
     """Get all unique themes with story counts via RPC or manual aggregation."""
-    result = (
-        client()
-        .table("extracted_stories")
-        .select("themes")
-        .execute()
+    rows = _rpc("theme_counts")
+    if rows is not None:
+        return rows
+    counts = Counter(
+        theme
+        for row in _iter_rows("extracted_stories", "themes")
+        for theme in (row.get("themes") or [])
     )
-    counts: dict[str, int] = {}
-    for row in result.data:
-        for theme in (row.get("themes") or []):
-            counts[theme] = counts.get(theme, 0) + 1
-    return [{"theme": t, "count": c} for t, c in sorted(counts.items(), key=lambda x: -x[1])]
+    return [{"theme": t, "count": c} for t, c in counts.most_common()]
 
 
 def get_themes_over_time(months: int = 12) -> list[dict[str, Any]]:
     """Get theme counts grouped by month for the last N months."""
+    rows = _rpc("themes_over_time", {"p_months": months})
+    if rows is not None:
+        return rows
     result = (
         client()
         .table("extracted_stories")
@@ -558,26 +1001,28 @@ def get_themes_over_time(months: int = 12) -> list[dict[str, Any]]:
 
 def get_sentiment_breakdown(profile_id: str | None = None) -> list[dict[str, Any]]:
     """Get sentiment distribution across stories."""
+    rows = _rpc("sentiment_breakdown", {"p_profile_id": profile_id})
+    if rows is not None:
+        return rows
     query = client().table("extracted_stories").select("sentiment")
     if profile_id:
         query = query.eq("profile_id", profile_id)
     result = query.execute()
 
-    counts: dict[str, int] = {}
-    total = 0
-    for row in result.data:
-        s = row.get("sentiment") or "unknown"
-        counts[s] = counts.get(s, 0) + 1
-        total += 1
+    counts = Counter(row.get("sentiment") or "unknown" for row in result.data)
+    total = len(result.data)
 
     return [
         {"sentiment": s, "count": c, "percentage": round(c / total * 100, 1) if total else 0}
-        for s, c in sorted(counts.items(), key=lambda x: -x[1])
+        for s, c in counts.most_common()
     ]
 
 
 def get_top_companies(limit: int = 10) -> list[dict[str, Any]]:
     """Get most-mentioned customer companies."""
+    rows = _rpc("top_companies", {"p_limit": limit})
+    if rows is not None:
+        return rows
     result = (
         client()
         .table("extracted_stories")
@@ -585,43 +1030,41 @@ def get_top_companies(limit: int = 10) -> list[dict[str, Any]]:
         .not_.is_("customer_company", "null")
         .execute()
     )
-    counts: dict[str, int] = {}
-    for row in result.data:
-        company = row.get("customer_company")
-        if company:
-            counts[company] = counts.get(company, 0) + 1
-    ranked = sorted(counts.items(), key=lambda x: -x[1])[:limit]
-    return [{"company": c, "story_count": n} for c, n in ranked]
+    counts = Counter(
+        row["customer_company"] for row in result.data if row.get("customer_company")
+    )
+    return [{"company": c, "story_count": n} for c, n in counts.most_common(limit)]
 
 
 def get_content_pipeline(profile_id: str | None = None) -> list[dict[str, Any]]:
     """Get content counts by status."""
+    rows = _rpc("content_pipeline", {"p_profile_id": profile_id})
+    if rows is not None:
+        return rows
     query = client().table("generated_content").select("status")
     if profile_id:
         query = query.eq("profile_id", profile_id)
     result = query.execute()
 
-    counts: dict[str, int] = {}
-    for row in result.data:
-        s = row.get("status") or "draft"
-        counts[s] = counts.get(s, 0) + 1
+    counts = Counter(row.get("status") or "draft" for row in result.data)
     return [{"status": s, "count": c} for s, c in counts.items()]
 
 
 def count_stories() -> int:
     """Count total extracted stories."""
-    result = client().table("extracted_stories").select("id", count="exact").execute()
-    return result.count or 0
+    return _row_count("extracted_stories")
 
 
 def count_content() -> int:
     """Count total generated content."""
-    result = client().table("generated_content").select("id", count="exact").execute()
-    return result.count or 0
+    return _row_count("generated_content")
 
 
 def get_next_version(story_id: str, content_type: str) -> int:
     """Get the next version number for a story+content_type pair."""
+    version = _rpc("next_content_version", {"p_story_id": story_id, "p_content_type": content_type})
+    if version is not None:
+        return version
     result = (
         client()
         .table("generated_content")
@@ -678,6 +1121,22 @@ def get_customer_quotes(
     offset: int = 0,
 ) -> tuple[list[dict[str, Any]], int]:
     """Scan stories for quoted text, return quotes with attribution."""
+    rows = _rpc(
+        "extract_quotes",
+        {
+            "p_theme": theme,
+            "p_company": company,
+            "p_sentiment": sentiment,
+            "p_limit": limit,
+            "p_offset": offset,
+        },
+    )
+    if rows is not None:
+        total = rows[0]["total_count"] if rows else 0
+        for row in rows:
+            del row["total_count"]
+        return rows, total
+
     query = client().table("extracted_stories").select("id, title, story_text, customer_name, customer_company, themes, sentiment")
     if theme:
         query = query.filter("themes", "cs", json.dumps([theme]))
@@ -712,26 +1171,26 @@ COMPETITORS = [
     "Apollo", "Groove", "Calendly", "Chili Piper", "Salesforce",
 ]
 
+# One alternation over the lowercased names scans each story text once.
+_COMPETITOR_BY_LOWER = {c.lower(): c for c in COMPETITORS}
+_COMPETITOR_RE = re.compile("|".join(re.escape(name) for name in _COMPETITOR_BY_LOWER))
+
 
 def get_competitor_mentions(limit: int = 20) -> list[dict[str, Any]]:
     """Scan story_text for known competitor names, aggregate counts."""
-    result = (
-        client()
-        .table("extracted_stories")
-        .select("id, story_text")
-        .execute()
-    )
-
+    rows = _rpc("competitor_mentions", {"p_names": COMPETITORS, "p_limit": limit})
+    if rows is not None:
+        return rows
     mentions: dict[str, dict[str, Any]] = {
         c: {"competitor": c, "count": 0, "story_ids": []} for c in COMPETITORS
     }
 
-    for row in result.data:
+    for row in _iter_rows("extracted_stories", "id, story_text"):
         text = (row.get("story_text") or "").lower()
-        for comp in COMPETITORS:
-            if comp.lower() in text:
-                mentions[comp]["count"] += 1
-                mentions[comp]["story_ids"].append(row["id"])
+        found = {_COMPETITOR_BY_LOWER[m.group(0)] for m in _COMPETITOR_RE.finditer(text)}
+        for comp in found:
+            mentions[comp]["count"] += 1
+            mentions[comp]["story_ids"].append(row["id"])
 
     ranked = sorted(mentions.values(), key=lambda x: -x["count"])
     return [m for m in ranked if m["count"] > 0][:limit]
@@ -749,10 +1208,10 @@ def create_campaign(data: dict[str, Any]) -> dict[str, Any]:
     return result.data[0]
 
 
+@_request_memoized
 def get_campaign(campaign_id: str) -> dict[str, Any] | None:
     """Fetch a single campaign by ID."""
-    result = client().table("campaigns").select("*").eq("id", campaign_id).execute()
-    return result.data[0] if result.data else None
+    return _one(client().table("campaigns").select("*").eq("id", campaign_id))
 
 
 def list_campaigns(
@@ -780,12 +1239,14 @@ def update_campaign(campaign_id: str, data: dict[str, Any]) -> dict[str, Any]:
         .eq("id", campaign_id)
         .execute()
     )
+    _forget_request_cache()
     return result.data[0]
 
 
 def delete_campaign(campaign_id: str) -> None:
     """Delete a campaign."""
     client().table("campaigns").delete().eq("id", campaign_id).execute()
+    _forget_request_cache()
 
 
 # -- Campaign-Story link operations --
@@ -814,27 +1275,48 @@ def remove_story_from_campaign(campaign_id: str, story_id: str) -> None:
     )
 
 
-def get_campaign_stories(campaign_id: str) -> list[dict[str, Any]]:
-    """Get all stories linked to a campaign."""
-    junction = (
+def add_stories_to_campaign(campaign_id: str, story_ids: list[str]) -> list[dict[str, Any]]:
+    """Link several stories to a campaign in one request.
+
+    Stories that are already linked are skipped; returns the new link rows.
+    """
+    if not story_ids:
+        return []
+    rows = [{"campaign_id": campaign_id, "story_id": sid} for sid in story_ids]
+    result = (
         client()
         .table("campaign_stories")
-        .select("story_id")
-        .eq("campaign_id", campaign_id)
+        .upsert(rows, on_conflict="campaign_id,story_id", ignore_duplicates=True)
         .execute()
     )
-    story_ids = [r["story_id"] for r in junction.data]
+    return result.data
+
+
+def remove_stories_from_campaign(campaign_id: str, story_ids: list[str]) -> None:
+    """Unlink several stories from a campaign in one request."""
     if not story_ids:
-        return []
+        return
+    (
+        client()
+        .table("campaign_stories")
+        .delete()
+        .eq("campaign_id", campaign_id)
+        .in_("story_id", story_ids)
+        .execute()
+    )
+
+
+def get_campaign_stories(campaign_id: str) -> list[dict[str, Any]]:
+    """Get all stories linked to a campaign."""
     result = (
         client()
         .table("extracted_stories")
-        .select("*")
-        .in_("id", story_ids)
+        .select(f"*, {_CAMPAIGN_LINK_EMBED}")
+        .eq("campaign_stories.campaign_id", campaign_id)
         .order("created_at", desc=True)
         .execute()
     )
-    return result.data
+    return _strip_campaign_link(result.data)
 
 
 def get_campaign_content(campaign_id: str) -> list[dict[str, Any]]:
@@ -859,10 +1341,10 @@ def create_brief(data: dict[str, Any]) -> dict[str, Any]:
     return result.data[0]
 
 
+@_request_memoized
 def get_brief(brief_id: str) -> dict[str, Any] | None:
     """Fetch a single content brief by ID."""
-    result = client().table("content_briefs").select("*").eq("id", brief_id).execute()
-    return result.data[0] if result.data else None
+    return _one(client().table("content_briefs").select("*").eq("id", brief_id))
 
 
 def list_briefs(
@@ -893,12 +1375,14 @@ def update_brief(brief_id: str, data: dict[str, Any]) -> dict[str, Any]:
         .eq("id", brief_id)
         .execute()
     )
+    _forget_request_cache()
     return result.data[0]
 
 
 def delete_brief(brief_id: str) -> None:
     """Delete a content brief."""
     client().table("content_briefs").delete().eq("id", brief_id).execute()
+    _forget_request_cache()
 
 
 # -- Approval operations --
@@ -913,40 +1397,56 @@ def init_approval_chain(content_id: str, stages: list[str]) -> dict[str, Any]:
     return update_content(content_id, {"approval_chain": chain})
 
 
-def advance_approval(
-    content_id: str, stage: str, approved_by: str, notes: str | None = None
+def _set_approval_step(
+    content_id: str, stage: str, status: str, person: str, notes: str | None
 ) -> dict[str, Any]:
-    """Mark an approval step as approved."""
+    """Set one approval step's outcome and return the updated content row.
+
+    The ``set_approval_step`` function rewrites the chain in a single atomic
+    UPDATE; without it, the chain is read, edited and written back.
+    """
+    rows = _rpc(
+        "set_approval_step",
+        {
+            "p_content_id": content_id,
+            "p_stage": stage,
+            "p_status": status,
+            "p_person": person,
+            "p_notes": notes,
+        },
+    )
+    if rows is not None:
+        _forget_request_cache()
+        if not rows:
+            raise ValueError(f"Content not found: {content_id}")
+        return rows[0]
+
     content = get_content(content_id)
     if not content:
         raise ValueError(f"Content not found: {content_id}")
     chain = content.get("approval_chain") or []
     for step in chain:
         if step["stage"] == stage:
-            step["status"] = "approved"
-            step["approved_by"] = approved_by
+            step["status"] = status
+            step["approved_by"] = person
             step["notes"] = notes
             step["timestamp"] = datetime.utcnow().isoformat()
             break
     return update_content(content_id, {"approval_chain": chain})
 
 
+def advance_approval(
+    content_id: str, stage: str, approved_by: str, notes: str | None = None
+) -> dict[str, Any]:
+    """Mark an approval step as approved."""
+    return _set_approval_step(content_id, stage, "approved", approved_by, notes)
+
+
 def reject_approval(
     content_id: str, stage: str, rejected_by: str, notes: str | None = None
 ) -> dict[str, Any]:
     """Mark an approval step as rejected."""
-    content = get_content(content_id)
-    if not content:
-        raise ValueError(f"Content not found: {content_id}")
-    chain = content.get("approval_chain") or []
-    for step in chain:
-        if step["stage"] == stage:
-            step["status"] = "rejected"
-            step["approved_by"] = rejected_by
-            step["notes"] = notes
-            step["timestamp"] = datetime.utcnow().isoformat()
-            break
-    return update_content(content_id, {"approval_chain": chain})
+    return _set_approval_step(content_id, stage, "rejected", rejected_by, notes)
 
 
 # -- Sales quote operations --
@@ -960,8 +1460,7 @@ def create_sales_quote(data: dict[str, Any]) -> dict[str, Any]:
 
 def get_sales_quote(quote_id: str) -> dict[str, Any] | None:
     """Fetch a single sales quote by ID."""
-    result = client().table("sales_quotes").select("*").eq("id", quote_id).execute()
-    return result.data[0] if result.data else None
+    return _one(client().table("sales_quotes").select("*").eq("id", quote_id))
 
 
 def list_sales_quotes(
@@ -1012,13 +1511,16 @@ def get_sales_quote_items(quote_id: str) -> list[dict[str, Any]]:
 
 def upsert_sales_quote_items(quote_id: str, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Replace all line items for a sales quote (delete-then-insert)."""
-    client().table("sales_quote_items").delete().eq("quote_id", quote_id).execute()
+    (
+        client()
+        .table("sales_quote_items")
+        .delete(returning=ReturnMethod.minimal)
+        .eq("quote_id", quote_id)
+        .execute()
+    )
     if not items:
         return []
-    rows = [
-        {**item, "quote_id": quote_id, "id": str(uuid.uuid4())}
-        for item in items
-    ]
+    rows = [{**item, "quote_id": quote_id} for item in items]
     result = client().table("sales_quote_items").insert(rows).execute()
     return result.data
 
@@ -1047,8 +1549,7 @@ def create_order(data: dict[str, Any]) -> dict[str, Any]:
 
 def get_order(order_id: str) -> dict[str, Any] | None:
     """Fetch a single order by ID."""
-    result = client().table("orders").select("*").eq("id", order_id).execute()
-    return result.data[0] if result.data else None
+    return _one(client().table("orders").select("*").eq("id", order_id))
 
 
 def list_orders(
@@ -1078,41 +1579,44 @@ def update_order(order_id: str, data: dict[str, Any]) -> dict[str, Any]:
 
 def get_recent_activity(limit: int = 15) -> list[dict[str, Any]]:
     """Get recent stories + content ordered by created_at."""
-    stories_result = (
-        client()
-        .table("extracted_stories")
-        .select("id, title, created_at")
-        .order("created_at", desc=True)
-        .limit(limit)
-        .execute()
-    )
-    content_result = (
-        client()
-        .table("generated_content")
-        .select("id, content_type, status, story_id, created_at")
-        .order("created_at", desc=True)
-        .limit(limit)
-        .execute()
-    )
+    rows = _rpc("recent_activity", {"p_limit": limit})
+    if rows is None:
+        stories_result, content_result = run_concurrently(
+            client()
+            .table("extracted_stories")
+            .select("id, title, created_at")
+            .order("created_at", desc=True)
+            .limit(limit)
+            .execute,
+            client()
+            .table("generated_content")
+            .select("id, content_type, status, story_id, created_at")
+            .order("created_at", desc=True)
+            .limit(limit)
+            .execute,
+        )
+        rows = [{**s, "source": "story"} for s in stories_result.data]
+        rows += [{**c, "source": "content"} for c in content_result.data]
 
     items: list[dict[str, Any]] = []
-    for s in stories_result.data:
-        items.append({
-            "type": "story_extracted",
-            "title": s.get("title", "Untitled"),
-            "detail": "New story extracted",
-            "entity_id": s["id"],
-            "created_at": s.get("created_at", ""),
-        })
-    for c in content_result.data:
-        ct = (c.get("content_type") or "content").replace("_", " ").title()
-        items.append({
-            "type": "content_generated",
-            "title": f"{ct} generated",
-            "detail": f"Status: {c.get('status', 'draft')}",
-            "entity_id": c.get("story_id", c["id"]),
-            "created_at": c.get("created_at", ""),
-        })
+    for r in rows:
+        if r["source"] == "story":
+            items.append({
+                "type": "story_extracted",
+                "title": r.get("title") or "Untitled",
+                "detail": "New story extracted",
+                "entity_id": r["id"],
+                "created_at": r.get("created_at", ""),
+            })
+        else:
+            ct = (r.get("content_type") or "content").replace("_", " ").title()
+            items.append({
+                "type": "content_generated",
+                "title": f"{ct} generated",
+                "detail": f"Status: {r.get('status') or 'draft'}",
+                "entity_id": r.get("story_id") or r["id"],
+                "created_at": r.get("created_at", ""),
+            })
 
     items.sort(key=lambda x: x.get("created_at", ""), reverse=True)
     return items[:limit]
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-from datetime import datetime, timezone
+import time
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from cirrus_ops import db
@@ -22,24 +28,43 @@ PLATFORM = "gong"
 # ---------------------------------------------------------------------------
 
 
-def _normalize_call(call: dict[str, Any], users: dict[str, Any]) -> dict[str, Any]:
+# Gong user ID -> (display name, email address), projected once per user list.
+UserDisplay = dict[str, tuple[str | None, str | None]]
+
+
+def _user_display(raw_users: list[dict[str, Any]]) -> UserDisplay:
+    """Project Gong user records down to the name and email the sync uses."""
+    return {
+        u["id"]: (
+            f"{u.get('firstName', '')} {u.get('lastName', '')}".strip() or None,
+            u.get("emailAddress"),
+        )
+        for u in raw_users
+    }
+
+
+def _call_id(call: dict[str, Any]) -> str:
+    """Return a Gong call's ID, which is also its meeting's ``external_id``."""
+    return str(call.get("id", call.get("metaData", {}).get("id", "")))
+
+
+def _normalize_call(
+    call: dict[str, Any], user_display: UserDisplay, call_id: str | None = None
+) -> dict[str, Any]:
     """Transform a raw Gong call dict into a ``meetings`` table row.
 
     Parameters
     ----------
     call:
         A single call object as returned by the Gong ``/v2/calls`` endpoint.
-    users:
-        A mapping of Gong user IDs to user records, used to resolve the host
-        display name.
+    user_display:
+        Gong user IDs mapped to ``(display name, email)``, used to resolve
+        the host.
+    call_id:
+        The call's ID if the caller already computed it with :func:`_call_id`.
     """
     host_user_id = call.get("metaData", {}).get("primaryUserId")
-    host_user = users.get(host_user_id, {}) if host_user_id else {}
-    host_name = (
-        f"{host_user.get('firstName', '')} {host_user.get('lastName', '')}".strip()
-        if host_user
-        else None
-    )
+    host_name, host_email = user_display.get(host_user_id, (None, None))
 
     meta = call.get("metaData", {})
     started = meta.get("started")
@@ -47,35 +72,34 @@ def _normalize_call(call: dict[str, Any], users: dict[str, Any]) -> dict[str, An
 
     # Gong provides duration in seconds; compute ended_at when possible.
     ended_at: str | None = None
-    if started and duration:
+    if started and isinstance(duration, (int, float)):
         try:
             start_dt = datetime.fromisoformat(started.replace("Z", "+00:00"))
-            end_dt = start_dt.replace(
-                second=start_dt.second + int(duration)
-            ) if isinstance(duration, (int, float)) else None
-            if end_dt is not None:
-                from datetime import timedelta
-
-                end_dt = start_dt + timedelta(seconds=int(duration))
-                ended_at = end_dt.isoformat()
+            ended_at = (start_dt + timedelta(seconds=int(duration))).isoformat()
         except (ValueError, TypeError):
             ended_at = None
 
     return {
         "platform": PLATFORM,
-        "external_id": str(call.get("id", call.get("metaData", {}).get("id", ""))),
+        "external_id": call_id if call_id is not None else _call_id(call),
         "title": meta.get("title"),
         "started_at": started,
         "ended_at": ended_at,
         "duration_seconds": int(duration) if duration else None,
         "host_name": host_name,
-        "host_email": host_user.get("emailAddress"),
+        "host_email": host_email,
         "raw_metadata": call,
     }
 
 
+def _content_hash(call: dict[str, Any]) -> str:
+    """Hash a raw Gong call payload, independent of key order."""
+    payload = orjson.dumps(call, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 def _normalize_participants(
-    call: dict[str, Any], users: dict[str, Any]
+    call: dict[str, Any], user_display: UserDisplay
 ) -> list[dict[str, Any]]:
     """Extract participants from a Gong call and resolve display names.
 
@@ -83,8 +107,8 @@ def _normalize_participants(
     ----------
     call:
         A single call object from the Gong API.
-    users:
-        A mapping of Gong user IDs to user records.
+    user_display:
+        Gong user IDs mapped to ``(display name, email)``.
 
     Returns
     -------
@@ -95,12 +119,8 @@ def _normalize_participants(
 
     for party in call.get("parties", []):
         user_id = party.get("userId")
-        user = users.get(user_id, {}) if user_id else {}
-        name = party.get("name") or (
-            f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
-            if user
-            else party.get("emailAddress")
-        )
+        display = user_display.get(user_id) if user_id else None
+        name = party.get("name") or (display[0] if display else party.get("emailAddress"))
 
         participants.append(
             {
@@ -139,20 +159,12 @@ def _normalize_transcript(transcript_data: dict[str, Any]) -> dict[str, Any]:
         speaker = seg.get("speakerName") or seg.get("speakerId", "Unknown")
         sentences = seg.get("sentences", [])
 
-        seg_text_parts: list[str] = []
-        start_time: float | None = None
-        end_time: float | None = None
-
-        for sentence in sentences:
-            seg_text_parts.append(sentence.get("text", ""))
-            s_start = sentence.get("start")
-            s_end = sentence.get("end")
-            if s_start is not None and (start_time is None or s_start < start_time):
-                start_time = s_start
-            if s_end is not None and (end_time is None or s_end > end_time):
-                end_time = s_end
+        seg_text = " ".join([sentence.get("text", "") for sentence in sentences])
+        starts = [s["start"] for s in sentences if s.get("start") is not None]
+        ends = [s["end"] for s in sentences if s.get("end") is not None]
+        start_time: float | None = min(starts) if starts else None
+        end_time: float | None = max(ends) if ends else None
 
-        seg_text = " ".join(seg_text_parts)
         text_parts.append(seg_text)
 
         segments.append(
@@ -165,7 +177,9 @@ def _normalize_transcript(transcript_data: dict[str, Any]) -> dict[str, Any]:
         )
 
     full_text = "\n".join(text_parts)
-    word_count = len(full_text.split())
+    # Words never span segments, so count per segment rather than splitting
+    # the whole transcript into one list the size of its word count.
+    word_count = sum(len(part.split()) for part in text_parts)
 
     return {
         "full_text": full_text,
@@ -174,6 +188,27 @@ def _normalize_transcript(transcript_data: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _advance_sync_token(token: str | None, calls: list[dict[str, Any]]) -> str | None:
+    """Return the latest call start time seen so far as a UTC ISO timestamp.
+
+    The token is the high-water mark of ``metaData.started`` across synced
+    calls, so the next incremental run asks Gong only for calls from that
+    point on -- independent of local clock skew or how long a run took.
+    """
+    latest = datetime.fromisoformat(token) if token else None
+    for call in calls:
+        started = call.get("metaData", {}).get("started")
+        if not started:
+            continue
+        try:
+            started_dt = datetime.fromisoformat(started.replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if latest is None or started_dt > latest:
+            latest = started_dt
+    return latest.astimezone(timezone.utc).isoformat() if latest else None
+
+
 # ---------------------------------------------------------------------------
 # Sync orchestration
 # ---------------------------------------------------------------------------
@@ -187,43 +222,35 @@ async def bulk_sync() -> None:
     2. Fetch all Gong users (for speaker/host name resolution).
     3. Paginate through **all** calls via the cursor.
     4. For each batch: upsert meetings, upsert participants, fetch + upsert
-       transcripts.
+       transcripts (up to ``sync_max_inflight`` batches at a time).
     5. Mark sync state as *complete* (or *error* on failure).
     """
     db.set_sync_running(PLATFORM)
-    total_synced = 0
     last_cursor: str | None = None
+    sync_token: str | None = None
 
     try:
         async with GongClient() as gong:
             # 1. Build a user lookup dict
-            raw_users = await gong.list_users()
-            users: dict[str, Any] = {u["id"]: u for u in raw_users}
-            logger.info("Fetched %d Gong users for name resolution.", len(users))
+            users = await _get_user_display(gong)
 
             # 2. Paginate through all calls
-            cursor: str | None = None
-            while True:
-                calls, next_cursor = await gong.list_calls(cursor=cursor)
-                if not calls:
-                    break
-
-                # Process in sub-batches of sync_batch_size
-                for i in range(0, len(calls), settings.sync_batch_size):
-                    batch = calls[i : i + settings.sync_batch_size]
-                    await _process_batch(gong, batch, users)
-                    total_synced += len(batch)
-                    logger.info(
-                        "Gong bulk sync progress: %d calls synced so far.",
-                        total_synced,
-                    )
-
-                last_cursor = next_cursor
-                cursor = next_cursor
-                if not cursor:
-                    break
-
-        db.set_sync_complete(PLATFORM, total_synced, last_cursor)
+            async with (
+                _BatchPool("bulk") as pool,
+                aclosing(_iter_call_pages(gong)) as pages,
+            ):
+                async for calls, next_cursor in pages:
+                    sync_token = _advance_sync_token(sync_token, calls)
+
+                    # Process in sub-batches of sync_batch_size
+                    for i in range(0, len(calls), settings.sync_batch_size):
+                        batch = calls[i : i + settings.sync_batch_size]
+                        await pool.submit(_process_batch(gong, batch, users), len(batch))
+
+                    last_cursor = next_cursor
+            total_synced = pool.total_synced
+
+        db.set_sync_complete(PLATFORM, total_synced, last_cursor, sync_token)
         logger.info("Gong bulk sync complete. Total calls synced: %d", total_synced)
 
     except Exception:
@@ -235,49 +262,42 @@ async def bulk_sync() -> None:
 async def incremental_sync() -> None:
     """Run an incremental sync starting from the last successful sync point.
 
-    Uses ``last_synced_at`` from the sync-state table as the ``fromDateTime``
-    filter so only new/updated calls are fetched.  Persists the cursor back
-    on completion.
+    Uses the stored ``sync_token`` (the latest call start time seen by a
+    previous run) as the ``fromDateTime`` filter so only new calls are
+    fetched, falling back to ``last_synced_at`` for rows synced before tokens
+    existed.  Persists the advanced token and cursor back on completion.
     """
     sync_state = db.get_sync_state(PLATFORM)
+    sync_token: str | None = None
     from_datetime: str | None = None
     if sync_state:
-        from_datetime = sync_state.get("last_synced_at")
+        sync_token = sync_state.get("sync_token")
+        from_datetime = sync_token or sync_state.get("last_synced_at")
 
     db.set_sync_running(PLATFORM)
-    total_synced = 0
     last_cursor: str | None = None
 
     try:
         async with GongClient() as gong:
-            raw_users = await gong.list_users()
-            users: dict[str, Any] = {u["id"]: u for u in raw_users}
-            logger.info("Fetched %d Gong users for name resolution.", len(users))
-
-            cursor: str | None = None
-            while True:
-                calls, next_cursor = await gong.list_calls(
-                    from_datetime=from_datetime,
-                    cursor=cursor,
-                )
-                if not calls:
-                    break
-
-                for i in range(0, len(calls), settings.sync_batch_size):
-                    batch = calls[i : i + settings.sync_batch_size]
-                    await _process_batch(gong, batch, users)
-                    total_synced += len(batch)
-                    logger.info(
-                        "Gong incremental sync progress: %d calls synced so far.",
-                        total_synced,
-                    )
-
-                last_cursor = next_cursor
-                cursor = next_cursor
-                if not cursor:
-                    break
-
-        db.set_sync_complete(PLATFORM, total_synced, last_cursor)
+            users = await _get_user_display(gong)
+
+            async with (
+                _BatchPool("incremental") as pool,
+                aclosing(_iter_call_pages(gong, from_datetime)) as pages,
+            ):
+                async for calls, next_cursor in pages:
+                    sync_token = _advance_sync_token(sync_token, calls)
+
+                    for i in range(0, len(calls), settings.sync_batch_size):
+                        batch = calls[i : i + settings.sync_batch_size]
+                        await pool.submit(
+                            _process_batch(gong, batch, users, skip_unchanged=True), len(batch)
+                        )
+
+                    last_cursor = next_cursor
+            total_synced = pool.total_synced
+
+        db.set_sync_complete(PLATFORM, total_synced, last_cursor, sync_token)
         logger.info(
             "Gong incremental sync complete. Total calls synced: %d",
             total_synced,
@@ -294,54 +314,291 @@ async def incremental_sync() -> None:
 # ---------------------------------------------------------------------------
 
 
+async def _iter_call_pages(
+    gong: GongClient, from_datetime: str | None = None
+) -> AsyncIterator[tuple[list[dict[str, Any]], str | None]]:
+    """Yield ``(calls, next_cursor)`` pages until an empty or final page.
+
+    The next page is requested as soon as the current one arrives, so its
+    round trip overlaps with the caller processing the current page.
+    """
+    pending = asyncio.create_task(gong.list_calls(from_datetime=from_datetime))
+    try:
+        while pending is not None:
+            calls, next_cursor = await pending
+            if not calls:
+                return
+            pending = (
+                asyncio.create_task(
+                    gong.list_calls(from_datetime=from_datetime, cursor=next_cursor)
+                )
+                if next_cursor
+                else None
+            )
+            yield calls, next_cursor
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+class _BatchPool:
+    """Run up to ``settings.sync_max_inflight`` batches concurrently.
+
+    ``submit`` waits for a free slot before starting the next batch, so
+    pages keep streaming in without unbounded fan-out.  Leaving the
+    ``async with`` block waits for the remaining batches, or cancels them if
+    the block raised.
+    """
+
+    def __init__(self, label: str) -> None:
+        self._label = label
+        self._sizes: dict[asyncio.Task[None], int] = {}
+        self.total_synced = 0
+
+    async def __aenter__(self) -> _BatchPool:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
+        if exc_type is not None:
+            for task in self._sizes:
+                task.cancel()
+            await asyncio.gather(*self._sizes, return_exceptions=True)
+            return
+        while self._sizes:
+            await self._wait(asyncio.ALL_COMPLETED)
+
+    async def submit(self, batch: Coroutine[Any, Any, None], size: int) -> None:
+        """Start *batch* (covering *size* calls) once a slot is free."""
+        try:
+            while len(self._sizes) >= settings.sync_max_inflight:
+                await self._wait(asyncio.FIRST_COMPLETED)
+        except BaseException:
+            batch.close()
+            raise
+        self._sizes[asyncio.create_task(batch)] = size
+
+    async def _wait(self, return_when: str) -> None:
+        done, _ = await asyncio.wait(self._sizes, return_when=return_when)
+        for task in done:
+            size = self._sizes.pop(task)
+            task.result()  # re-raise a batch's unexpected failure
+            self.total_synced += size
+            logger.info(
+                "Gong %s sync progress: %d calls synced so far.",
+                self._label,
+                self.total_synced,
+            )
+
+
+# Gong users change rarely, so the user display lookup is reused across syncs
+# in the same process for ``gong_user_cache_ttl`` seconds.
+_users_cache: tuple[float, UserDisplay] | None = None
+
+
+async def _get_user_display(gong: GongClient) -> UserDisplay:
+    """Return Gong user IDs mapped to ``(display name, email)``, cached with a TTL."""
+    global _users_cache
+    if _users_cache is not None:
+        fetched_at, users = _users_cache
+        if time.monotonic() - fetched_at < settings.gong_user_cache_ttl:
+            return users
+    raw_users = await gong.list_users()
+    users = _user_display(raw_users)
+    logger.info("Fetched %d Gong users for name resolution.", len(users))
+    _users_cache = (time.monotonic(), users)
+    return users
+
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), reraise=True)
 def _db_upsert_meeting(data: dict[str, Any]) -> dict[str, Any]:
     """Upsert a meeting with retry on transient connection errors."""
     return db.upsert_meeting(data)
 
 
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), reraise=True)
+def _db_upsert_meetings(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Upsert a batch of meetings with retry on transient connection errors."""
+    return db.upsert_meetings(rows)
+
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), reraise=True)
 def _db_upsert_participants(meeting_id: str, participants: list[dict[str, Any]]) -> None:
     """Upsert participants with retry on transient connection errors."""
     db.upsert_participants(meeting_id, participants)
 
 
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), reraise=True)
+def _db_replace_participants_batch(
+    participants_by_meeting: dict[str, list[dict[str, Any]]],
+) -> None:
+    """Replace a batch's participants with retry on transient connection errors."""
+    db.replace_participants_batch(participants_by_meeting)
+
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), reraise=True)
 def _db_upsert_transcript(data: dict[str, Any]) -> None:
     """Upsert a transcript with retry on transient connection errors."""
     db.upsert_transcript(data)
 
 
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30), reraise=True)
+def _db_upsert_transcripts(rows: list[dict[str, Any]]) -> None:
+    """Upsert a batch of transcripts with retry on transient connection errors."""
+    db.upsert_transcripts(rows)
+
+
+def _upsert_batch_meetings(meeting_rows: dict[str, dict[str, Any]]) -> dict[str, str]:
+    """Upsert meeting rows keyed by external ID; return external ID -> meeting ID.
+
+    The whole batch goes out in one request.  If that fails, the rows are
+    retried one at a time so a single bad row only costs its own call.
+    """
+    try:
+        upserted = _db_upsert_meetings(list(meeting_rows.values()))
+    except Exception:
+        logger.warning(
+            "Batch upsert of %d meetings failed, retrying row by row",
+            len(meeting_rows),
+            exc_info=True,
+        )
+        upserted = []
+        for external_id, row in meeting_rows.items():
+            try:
+                upserted.append(_db_upsert_meeting(row))
+            except Exception:
+                logger.error("Failed to upsert call %s, skipping", external_id, exc_info=True)
+    return {row["external_id"]: row["id"] for row in upserted}
+
+
+def _replace_batch_participants(participants_by_meeting: dict[str, list[dict[str, Any]]]) -> None:
+    """Replace a batch's participants in one request, meeting by meeting if that fails."""
+    try:
+        _db_replace_participants_batch(participants_by_meeting)
+    except Exception:
+        logger.warning(
+            "Batch replace of participants for %d meetings failed, retrying per meeting",
+            len(participants_by_meeting),
+            exc_info=True,
+        )
+        for meeting_id, participants in participants_by_meeting.items():
+            try:
+                _db_upsert_participants(meeting_id, participants)
+            except Exception:
+                logger.error(
+                    "Failed to upsert participants for meeting %s, skipping",
+                    meeting_id,
+                    exc_info=True,
+                )
+
+
+def _upsert_batch_transcripts(rows: list[dict[str, Any]]) -> None:
+    """Upsert a batch's transcripts in one request, row by row if that fails."""
+    try:
+        _db_upsert_transcripts(rows)
+    except Exception:
+        logger.warning(
+            "Batch upsert of %d transcripts failed, retrying row by row",
+            len(rows),
+            exc_info=True,
+        )
+        for row in rows:
+            try:
+                _db_upsert_transcript(row)
+            except Exception:
+                logger.error(
+                    "Failed to upsert transcript for meeting %s, skipping",
+                    row["meeting_id"],
+                    exc_info=True,
+                )
+
+
+def _unchanged_call_ids(hashes: dict[str, str]) -> set[str]:
+    """Return the IDs of calls already synced from an identical payload."""
+    try:
+        synced = db.get_synced_meeting_hashes(PLATFORM, list(hashes))
+    except Exception:
+        logger.warning("Could not load meeting hashes, reprocessing batch", exc_info=True)
+        return set()
+    return {call_id for call_id, h in hashes.items() if synced.get(call_id) == h}
+
+
 async def _process_batch(
     gong: GongClient,
     calls: list[dict[str, Any]],
-    users: dict[str, Any],
+    users: UserDisplay,
+    skip_unchanged: bool = False,
 ) -> None:
-    """Upsert meetings, participants, and transcripts for a batch of calls."""
-    for call in calls:
+    """Upsert meetings, participants, and transcripts for a batch of calls.
+
+    Blocking database writes run in worker threads so that concurrent
+    batches (see :class:`_BatchPool`) keep the event loop free for their
+    Gong requests.  With *skip_unchanged*, calls whose payload hash matches the stored
+    ``content_hash`` of a fully synced meeting are skipped entirely.
+    """
+    keyed_calls = [(_call_id(call), call) for call in calls]
+    hashes = {call_id: _content_hash(call) for call_id, call in keyed_calls}
+    if skip_unchanged:
+        unchanged = await asyncio.to_thread(_unchanged_call_ids, hashes)
+        if unchanged:
+            logger.debug("Skipping %d unchanged calls", len(unchanged))
+            keyed_calls = [(cid, call) for cid, call in keyed_calls if cid not in unchanged]
+
+    # Upsert all meeting rows at once; keyed by external ID, which also drops
+    # duplicates that Postgres would reject within a single upsert.
+    meeting_rows: dict[str, dict[str, Any]] = {}
+    for call_id, call in keyed_calls:
         try:
-            # Upsert the meeting row
-            meeting_data = _normalize_call(call, users)
-            meeting = _db_upsert_meeting(meeting_data)
-            meeting_id: str = meeting["id"]
-
-            # Upsert participants
-            participants = _normalize_participants(call, users)
-            _db_upsert_participants(meeting_id, participants)
-
-            # Fetch and upsert transcript
-            call_id = str(call.get("id", call.get("metaData", {}).get("id", "")))
-            transcript_data = await gong.get_call_transcript(call_id)
-            if transcript_data:
-                normalized = _normalize_transcript(transcript_data)
-                normalized["meeting_id"] = meeting_id
-                _db_upsert_transcript(normalized)
+            row = _normalize_call(call, users, call_id)
         except Exception:
+            logger.error("Failed to normalize call %s, skipping", call_id, exc_info=True)
+            continue
+        row["content_hash"] = hashes[call_id]
+        meeting_rows[call_id] = row
+    meeting_ids = await asyncio.to_thread(_upsert_batch_meetings, meeting_rows)
+
+    synced: dict[str, str] = {}
+    participants_by_meeting: dict[str, list[dict[str, Any]]] = {}
+    for call_id, call in keyed_calls:
+        meeting_id = meeting_ids.get(call_id)
+        if meeting_id is None:
+            continue
+        try:
+            participants_by_meeting[meeting_id] = _normalize_participants(call, users)
+        except Exception:
+            logger.error("Failed to process call %s, skipping", call_id, exc_info=True)
+            continue
+        synced[call_id] = meeting_id
+    await asyncio.to_thread(_replace_batch_participants, participants_by_meeting)
+
+    # Fetch transcripts concurrently, at most sync_concurrency in flight.
+    sem = asyncio.Semaphore(settings.sync_concurrency)
+
+    async def _fetch(call_id: str) -> dict[str, Any] | None:
+        async with sem:
+            return await gong.get_call_transcript(call_id)
+
+    transcripts = await asyncio.gather(
+        *(_fetch(call_id) for call_id in synced), return_exceptions=True
+    )
+    transcript_rows: list[dict[str, Any]] = []
+    for (call_id, meeting_id), transcript_data in zip(synced.items(), transcripts):
+        if isinstance(transcript_data, BaseException):
             logger.error(
-                "Failed to process call %s, skipping",
-                call.get("metaData", {}).get("id", "unknown"),
-                exc_info=True,
+                "Failed to fetch transcript for call %s, skipping",
+                call_id,
+                exc_info=transcript_data,
             )
+            continue
+        if not transcript_data:
+            continue
+        try:
+            normalized = _normalize_transcript(transcript_data)
+        except Exception:
+            logger.error("Failed to process call %s, skipping", call_id, exc_info=True)
+            continue
+        normalized["meeting_id"] = meeting_id
+        transcript_rows.append(normalized)
+    await asyncio.to_thread(_upsert_batch_transcripts, transcript_rows)
 
 
 def _format_error() -> str:
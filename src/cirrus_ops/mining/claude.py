@@ -0,0 +1,94 @@
+"""Shared Anthropic client for mining operations."""
+
+from __future__ import annotations
+
+import logging
+import time
+from functools import lru_cache
+from typing import Any
+
+import anthropic
+from anthropic.types import Message
+
+from cirrus_ops.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def client() -> anthropic.Anthropic:
+    """Return the process-wide Anthropic client.
+
+    Reusing one client keeps its HTTP connection pool alive across calls, so
+    batch extraction and generation don't pay a fresh TLS handshake per meeting.
+    """
+    return anthropic.Anthropic(api_key=settings.anthropic_api_key)
+
+
+def cached_system(text: str) -> list[dict[str, Any]]:
+    """Return ``text`` as a system block marked as a prompt-cache breakpoint.
+
+    The cached prefix covers the tools and the system prompt, so repeated calls
+    with the same profile (chunks of one transcript, content types of one
+    story) are billed at the cache-read rate after the first.
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+def run_batch(requests: dict[str, dict[str, Any]]) -> dict[str, Message | None]:
+    """Run Messages requests through the Message Batches API and wait for them.
+
+    Args:
+        requests: Mapping of custom_id to ``messages.create`` parameters.
+
+    Polling stops after ``settings.claude_batch_max_wait_seconds``; the batch
+    is then canceled so it stops accruing cost.
+
+    Returns:
+        A dict mapping each custom_id to its response message, or None if that
+        request errored, expired, or was canceled.
+
+    Raises:
+        TimeoutError: If the batch hasn't ended within the max wait.
+    """
+    if not requests:
+        return {}
+
+    batches = client().messages.batches
+    batch = batches.create(
+        requests=[
+            {"custom_id": custom_id, "params": params}
+            for custom_id, params in requests.items()
+        ]
+    )
+    logger.info("Submitted message batch %s (%d requests)", batch.id, len(requests))
+
+    deadline = time.monotonic() + settings.claude_batch_max_wait_seconds
+    while batch.processing_status != "ended":
+        if time.monotonic() >= deadline:
+            batches.cancel(batch.id)
+            raise TimeoutError(
+                f"Message batch {batch.id} did not finish within "
+                f"{settings.claude_batch_max_wait_seconds:.0f}s; canceled"
+            )
+        time.sleep(settings.claude_batch_poll_seconds)
+        batch = batches.retrieve(batch.id)
+
+    results: dict[str, Message | None] = dict.fromkeys(requests)
+    for entry in batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            results[entry.custom_id] = entry.result.message
+        else:
+            logger.warning(
+                "Batch request %s did not succeed: %s",
+                entry.custom_id,
+                entry.result.type,
+            )
+
+    logger.info(
+        "Message batch %s ended: %d/%d succeeded",
+        batch.id,
+        sum(message is not None for message in results.values()),
+        len(requests),
+    )
+    return results
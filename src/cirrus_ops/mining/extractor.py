@@ -1,12 +1,20 @@
 """Claude-powered story and insight extraction from meeting transcripts."""
 
+import asyncio
 import logging
-from difflib import SequenceMatcher
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import chain, islice
 
 import anthropic
+from anthropic.types import Message
+from rapidfuzz import fuzz, process
 
 from cirrus_ops.config import settings
 from cirrus_ops.mining.prompts import STORY_EXTRACTION_SYSTEM, STORY_EXTRACTION_USER
+from cirrus_ops.mining import claude
 from cirrus_ops.mining import profiles as profile_mod
 from cirrus_ops import db
 
@@ -17,12 +25,21 @@ CHUNK_SIZE = 60_000  # words per chunk
 CHUNK_OVERLAP = 5_000  # overlap between chunks for context continuity
 DEDUP_SIMILARITY_THRESHOLD = 0.8
 
+# rapidfuzz scores on a 0-100 scale
+_DEDUP_SCORE_CUTOFF = DEDUP_SIMILARITY_THRESHOLD * 100
 
-def _build_tool_schema(themes: list[str] | None = None) -> dict:
+_WORD_RE = re.compile(r"\S+")
+
+
+@lru_cache(maxsize=32)
+def _build_tool_schema(themes: tuple[str, ...] | None = None) -> dict:
     """Return the tool definition dict for structured story extraction.
 
+    The result is memoized per themes tuple and shared between callers, so it
+    must not be mutated.
+
     Args:
-        themes: Optional list of themes to constrain the themes enum. If None,
+        themes: Optional tuple of themes to constrain the themes enum. If None,
             uses a free-form string array.
     """
     themes_schema: dict
@@ -110,49 +127,65 @@ def _build_tool_schema(themes: list[str] | None = None) -> dict:
     }
 
 
-def _chunk_transcript(transcript: str) -> list[str]:
-    """Split a long transcript into overlapping word-based chunks."""
-    words = transcript.split()
-    chunks: list[str] = []
-    start = 0
-    while start < len(words):
-        end = start + CHUNK_SIZE
-        chunk = " ".join(words[start:end])
-        chunks.append(chunk)
-        start += CHUNK_SIZE - CHUNK_OVERLAP
-    logger.info("Split transcript into %d chunks", len(chunks))
-    return chunks
+def _chunk_transcript(transcript: str) -> Iterator[str]:
+    """Yield overlapping word-based chunks of a long transcript.
 
-
-def _titles_are_similar(title_a: str, title_b: str) -> bool:
-    """Check if two story titles are similar enough to be considered duplicates."""
-    ratio = SequenceMatcher(None, title_a.lower(), title_b.lower()).ratio()
-    return ratio >= DEDUP_SIMILARITY_THRESHOLD
+    One pass over the words tracks only the start offsets of chunks still
+    being scanned, and each chunk is sliced from the original text (keeping
+    its line breaks) as soon as its last word is reached, so callers can
+    dispatch it before the rest of the transcript has been scanned.
+    """
+    step = CHUNK_SIZE - CHUNK_OVERLAP
+    pending: deque[tuple[int, int]] = deque()  # (first word index, char offset)
+    count = 0
+    last_end = 0
+    for i, match in enumerate(_WORD_RE.finditer(transcript)):
+        if i % step == 0:
+            pending.append((i, match.start()))
+        last_end = match.end()
+        if i == pending[0][0] + CHUNK_SIZE - 1:
+            count += 1
+            yield transcript[pending.popleft()[1]:last_end]
+    # Chunks cut short by the end of the transcript
+    for _, start_char in pending:
+        count += 1
+        yield transcript[start_char:last_end]
+    logger.info("Split transcript into %d chunks", count)
 
 
 def _deduplicate_stories(stories: list[dict]) -> list[dict]:
-    """Remove duplicate stories based on title similarity."""
+    """Remove duplicate stories based on title similarity.
+
+    Each story is scored against every kept title in one rapidfuzz call, and
+    merged with the closest one if it clears the threshold.
+    """
     unique: list[dict] = []
+    titles: list[str] = []
     for story in stories:
-        is_duplicate = False
-        for existing in unique:
-            if _titles_are_similar(story["title"], existing["title"]):
-                # Keep the one with higher confidence
-                if story.get("confidence_score", 0) > existing.get("confidence_score", 0):
-                    unique.remove(existing)
-                    unique.append(story)
-                is_duplicate = True
-                break
-        if not is_duplicate:
+        title = story["title"].lower()
+        match = process.extractOne(
+            title,
+            titles,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=_DEDUP_SCORE_CUTOFF,
+        )
+        if match is None:
             unique.append(story)
+            titles.append(title)
+            continue
+        i = match[2]
+        if story.get("confidence_score", 0) > unique[i].get("confidence_score", 0):
+            # Keep the one with higher confidence
+            unique[i] = story
+            titles[i] = title
     logger.info(
         "Deduplicated %d stories down to %d", len(stories), len(unique)
     )
     return unique
 
 
-def _call_claude_for_stories(
-    client: anthropic.Anthropic,
+def _story_request(
     transcript: str,
     title: str,
     date: str,
@@ -160,27 +193,26 @@ def _call_claude_for_stories(
     system_prompt: str,
     user_prompt_template: str,
     tool_schema: dict,
-) -> list[dict]:
-    """Call Claude with the extraction prompt and tool, returning parsed stories."""
+) -> dict:
+    """Build the ``messages.create`` parameters for one extraction call."""
     user_prompt = user_prompt_template.format(
         title=title,
         date=date,
         participants=participants,
         transcript=transcript,
     )
+    return {
+        "model": settings.claude_model,
+        "max_tokens": 16384,
+        "system": claude.cached_system(system_prompt),
+        "tools": [tool_schema],
+        "tool_choice": {"type": "tool", "name": "extract_stories"},
+        "messages": [{"role": "user", "content": user_prompt}],
+    }
 
-    logger.info("Calling Claude for story extraction (model: %s)", settings.claude_model)
-
-    response = client.messages.create(
-        model=settings.claude_model,
-        max_tokens=16384,
-        system=system_prompt,
-        tools=[tool_schema],
-        tool_choice={"type": "tool", "name": "extract_stories"},
-        messages=[{"role": "user", "content": user_prompt}],
-    )
 
-    # Parse the tool_use response block
+def _parse_stories(response: Message) -> list[dict]:
+    """Return the stories from the ``extract_stories`` tool_use block of a response."""
     for block in response.content:
         if block.type == "tool_use" and block.name == "extract_stories":
             stories = block.input.get("stories", [])
@@ -191,6 +223,85 @@ def _call_claude_for_stories(
     return []
 
 
+def _call_claude_for_stories(
+    client: anthropic.Anthropic,
+    transcript: str,
+    title: str,
+    date: str,
+    participants: str,
+    system_prompt: str,
+    user_prompt_template: str,
+    tool_schema: dict,
+) -> list[dict]:
+    """Call Claude with the extraction prompt and tool, returning parsed stories.
+
+    The response is streamed so a long tool_use generation (up to 16k tokens)
+    keeps the connection active instead of idling until it completes; the SDK
+    assembles the tool input from the ``input_json`` deltas.
+    """
+    logger.info("Calling Claude for story extraction (model: %s)", settings.claude_model)
+
+    with client.messages.stream(
+        **_story_request(
+            transcript,
+            title,
+            date,
+            participants,
+            system_prompt,
+            user_prompt_template,
+            tool_schema,
+        )
+    ) as stream:
+        response = stream.get_final_message()
+    return _parse_stories(response)
+
+
+async def _extract_chunks(
+    client: anthropic.Anthropic,
+    chunks: Iterable[str],
+    title: str,
+    date: str,
+    participants: str,
+    system_prompt: str,
+    user_prompt_template: str,
+    tool_schema: dict,
+) -> list[dict]:
+    """Extract stories from all chunks concurrently, bounded by ``claude_concurrency``.
+
+    Workers pull chunks from the shared iterator as they free up, so only the
+    chunks in flight are held in memory. Each call runs the shared sync client
+    in a worker thread, so the chunks reuse its connection pool instead of
+    opening one per event loop. Results are returned in chunk order.
+    """
+    numbered = enumerate(chunks)
+    results: dict[int, list[dict]] = {}
+
+    async def _worker() -> None:
+        for i, chunk in numbered:
+            logger.info("Processing chunk %d", i + 1)
+            results[i] = await asyncio.to_thread(
+                _call_claude_for_stories,
+                client,
+                chunk,
+                title,
+                date,
+                participants,
+                system_prompt,
+                user_prompt_template,
+                tool_schema,
+            )
+
+    await asyncio.gather(*(_worker() for _ in range(settings.claude_concurrency)))
+    return list(chain.from_iterable(results[i] for i in sorted(results)))
+
+
+def _embedded_one(value: dict | list | None) -> dict | None:
+    """Return a one-to-one embedded resource, which PostgREST may render as a list."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
 def extract_stories(meeting_id: str, profile_name: str = "default") -> list[dict]:
     """Extract customer stories from a meeting transcript using Claude.
 
@@ -204,97 +315,84 @@ def extract_stories(meeting_id: str, profile_name: str = "default") -> list[dict
     Raises:
         ValueError: If the meeting or its transcript is not found.
     """
-    logger.info(
-        "Starting story extraction for meeting %s (profile: %s)",
-        meeting_id,
-        profile_name,
-    )
+    meeting_row = db.get_meeting_for_mining(meeting_id)
+    if meeting_row is None:
+        raise ValueError(f"Meeting not found: {meeting_id}")
+    return extract_stories_from_row(meeting_row, profile_name=profile_name)
 
-    # Load the profile
-    profile = profile_mod.load_profile(profile_name)
-    profile_id = profile["id"]
 
-    # Build grounded system prompt
-    system_prompt = profile_mod.build_extraction_system_prompt(profile)
-    user_prompt_template = profile["extraction_user_prompt"]
+def _extraction_setup(profile_name: str) -> dict:
+    """Load a profile and build the prompt pieces shared by all its extractions."""
+    profile = profile_mod.load_profile(profile_name)
 
     # Use profile's tool schema override or build from profile themes
     if profile.get("extraction_tool_schema"):
         tool_schema = profile["extraction_tool_schema"]
     else:
         themes = profile.get("themes", [])
-        tool_schema = _build_tool_schema(themes if themes else None)
+        tool_schema = _build_tool_schema(tuple(themes) if themes else None)
+
+    return {
+        "profile": profile,
+        # Build grounded system prompt
+        "system_prompt": profile_mod.build_extraction_system_prompt(profile),
+        "user_prompt_template": profile["extraction_user_prompt"],
+        "tool_schema": tool_schema,
+    }
 
-    meeting = db.get_meeting(meeting_id)
-    if meeting is None:
-        raise ValueError(f"Meeting not found: {meeting_id}")
 
-    transcript_row = db.get_transcript(meeting_id)
+def _meeting_context(meeting_row: dict) -> dict:
+    """Pull the transcript and prompt context out of a mining meeting row.
+
+    Raises:
+        ValueError: If the meeting has no transcript.
+    """
+    meeting_id = meeting_row["id"]
+    transcript_row = _embedded_one(meeting_row.get("transcripts"))
     if transcript_row is None or not transcript_row.get("full_text"):
         raise ValueError(f"No transcript found for meeting: {meeting_id}")
 
     full_text = transcript_row["full_text"]
-    title = meeting.get("title") or "Untitled Meeting"
-    date = meeting.get("started_at") or "Unknown"
-
-    # Build participant context from the participants table
-    participants_result = (
-        db.client()
-        .table("participants")
-        .select("name, email, company")
-        .eq("meeting_id", meeting_id)
-        .execute()
-    )
+
+    # Build participant context from the embedded participants
     participant_names = [
         p.get("name") or p.get("email") or "Unknown"
-        for p in participants_result.data
+        for p in meeting_row.get("participants") or []
     ]
-    participants_str = ", ".join(participant_names) if participant_names else "Unknown"
-
-    claude_client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
 
     # Handle long transcripts by chunking
-    word_count = transcript_row.get("word_count") or len(full_text.split())
-    logger.info("Transcript word count: %d", word_count)
-
-    if word_count > CHUNK_WORD_LIMIT:
+    word_count = transcript_row.get("word_count")
+    # Every word takes at least one character plus a separator, so a shorter
+    # text can't exceed the limit and needs no count
+    if not word_count and len(full_text) > 2 * CHUNK_WORD_LIMIT:
+        word_count = sum(1 for _ in _WORD_RE.finditer(full_text))
+        db.set_transcript_word_count(meeting_id, word_count)
+    if word_count:
+        logger.info("Transcript word count: %d", word_count)
+
+    chunked = bool(word_count and word_count > CHUNK_WORD_LIMIT)
+    if chunked:
         logger.info(
             "Transcript exceeds %d words, chunking for processing",
             CHUNK_WORD_LIMIT,
         )
-        chunks = _chunk_transcript(full_text)
-        all_stories: list[dict] = []
-        for i, chunk in enumerate(chunks):
-            logger.info("Processing chunk %d/%d", i + 1, len(chunks))
-            chunk_stories = _call_claude_for_stories(
-                claude_client,
-                chunk,
-                title,
-                str(date),
-                participants_str,
-                system_prompt,
-                user_prompt_template,
-                tool_schema,
-            )
-            all_stories.extend(chunk_stories)
-        stories = _deduplicate_stories(all_stories)
-    else:
-        stories = _call_claude_for_stories(
-            claude_client,
-            full_text,
-            title,
-            str(date),
-            participants_str,
-            system_prompt,
-            user_prompt_template,
-            tool_schema,
-        )
 
+    return {
+        "meeting_id": meeting_id,
+        "full_text": full_text,
+        "title": meeting_row.get("title") or "Untitled Meeting",
+        "date": str(meeting_row.get("started_at") or "Unknown"),
+        "participants": ", ".join(participant_names) if participant_names else "Unknown",
+        "chunked": chunked,
+    }
+
+
+def _save_stories(meeting_id: str, stories: list[dict], profile: dict) -> list[dict]:
+    """Persist the stories that clear the profile's confidence threshold."""
     # Filter by confidence threshold
     threshold = profile.get("confidence_threshold", 0.5)
 
-    # Persist each story to the database
-    inserted: list[dict] = []
+    rows: list[dict] = []
     for story in stories:
         if story.get("confidence_score", 0) < threshold:
             logger.info(
@@ -305,9 +403,9 @@ def extract_stories(meeting_id: str, profile_name: str = "default") -> list[dict
             )
             continue
 
-        record = db.insert_story({
+        rows.append({
             "meeting_id": meeting_id,
-            "profile_id": profile_id,
+            "profile_id": profile["id"],
             "title": story["title"],
             "summary": story["summary"],
             "story_text": story["story_text"],
@@ -318,8 +416,15 @@ def extract_stories(meeting_id: str, profile_name: str = "default") -> list[dict
             "confidence_score": story["confidence_score"],
             "raw_analysis": story,
         })
-        inserted.append(record)
-        logger.info("Inserted story: %s (confidence=%.2f)", story["title"], story["confidence_score"])
+
+    # Persist all stories in one request
+    inserted = db.insert_stories(rows)
+    for record in inserted:
+        logger.info(
+            "Inserted story: %s (confidence=%.2f)",
+            record["title"],
+            record["confidence_score"],
+        )
 
     logger.info(
         "Extraction complete for meeting %s: %d stories inserted",
@@ -327,3 +432,127 @@ def extract_stories(meeting_id: str, profile_name: str = "default") -> list[dict
         len(inserted),
     )
     return inserted
+
+
+def extract_stories_from_row(meeting_row: dict, *, profile_name: str = "default") -> list[dict]:
+    """Extract customer stories from a pre-fetched meeting row.
+
+    Args:
+        meeting_row: A meeting dict selected with ``db.MINING_MEETING_FIELDS``,
+            i.e. with ``transcripts`` and ``participants`` embedded.
+        profile_name: The mining profile to use (default: "default").
+
+    Returns:
+        A list of dicts representing the inserted story records.
+
+    Raises:
+        ValueError: If the meeting has no transcript.
+    """
+    logger.info(
+        "Starting story extraction for meeting %s (profile: %s)",
+        meeting_row["id"],
+        profile_name,
+    )
+
+    setup = _extraction_setup(profile_name)
+    ctx = _meeting_context(meeting_row)
+    args = (
+        ctx["title"],
+        ctx["date"],
+        ctx["participants"],
+        setup["system_prompt"],
+        setup["user_prompt_template"],
+        setup["tool_schema"],
+    )
+
+    claude_client = claude.client()
+    if ctx["chunked"]:
+        all_stories = asyncio.run(
+            _extract_chunks(claude_client, _chunk_transcript(ctx["full_text"]), *args)
+        )
+        stories = _deduplicate_stories(all_stories)
+    else:
+        stories = _call_claude_for_stories(claude_client, ctx["full_text"], *args)
+
+    return _save_stories(ctx["meeting_id"], stories, setup["profile"])
+
+
+def extract_stories_batch(
+    meeting_rows: Iterable[dict],
+    *,
+    profile_name: str = "default",
+    group_size: int = 50,
+) -> tuple[dict[str, list[dict]], dict[str, str]]:
+    """Extract stories from many meetings through the Message Batches API.
+
+    Meant for offline bulk mining: the requests for each ``group_size``
+    meetings (all chunks included) go out as one batch, billed at the batch
+    rate, and are waited on via ``claude.run_batch``, which can take a long
+    time. Interactive callers should use ``extract_stories_from_row``.
+
+    Args:
+        meeting_rows: Meeting dicts selected with ``db.MINING_MEETING_FIELDS``.
+        profile_name: The mining profile to use (default: "default").
+        group_size: Number of meetings submitted per batch.
+
+    Returns:
+        A ``(stories_by_meeting, skipped)`` pair: the inserted story records
+        per meeting ID, and the reason each skipped meeting was not mined.
+        Meetings with a failed batch request are skipped whole, so re-running
+        them doesn't duplicate the stories of their successful chunks.
+
+    Raises:
+        TimeoutError: If a batch doesn't finish within
+            ``settings.claude_batch_max_wait_seconds``.
+    """
+    setup = _extraction_setup(profile_name)
+    stories_by_meeting: dict[str, list[dict]] = {}
+    skipped: dict[str, str] = {}
+
+    rows = iter(meeting_rows)
+    while group := list(islice(rows, group_size)):
+        contexts: list[dict] = []
+        requests: dict[str, dict] = {}
+        owners: dict[str, int] = {}
+        for row in group:
+            try:
+                ctx = _meeting_context(row)
+            except ValueError as e:
+                skipped[row["id"]] = str(e)
+                continue
+            texts = _chunk_transcript(ctx["full_text"]) if ctx["chunked"] else [ctx["full_text"]]
+            for i, text in enumerate(texts):
+                custom_id = f"m{len(contexts)}-c{i}"
+                requests[custom_id] = _story_request(
+                    text,
+                    ctx["title"],
+                    ctx["date"],
+                    ctx["participants"],
+                    setup["system_prompt"],
+                    setup["user_prompt_template"],
+                    setup["tool_schema"],
+                )
+                owners[custom_id] = len(contexts)
+            contexts.append(ctx)
+
+        extracted: list[list[dict]] = [[] for _ in contexts]
+        failed: set[int] = set()
+        for custom_id, response in claude.run_batch(requests).items():
+            if response is None:
+                failed.add(owners[custom_id])
+            else:
+                extracted[owners[custom_id]].extend(_parse_stories(response))
+
+        for n, ctx in enumerate(contexts):
+            meeting_id = ctx["meeting_id"]
+            if n in failed:
+                skipped[meeting_id] = "Claude batch request failed"
+                continue
+            stories = extracted[n]
+            if ctx["chunked"]:
+                stories = _deduplicate_stories(stories)
+            stories_by_meeting[meeting_id] = _save_stories(
+                meeting_id, stories, setup["profile"]
+            )
+
+    return stories_by_meeting, skipped
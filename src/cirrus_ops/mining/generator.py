@@ -2,68 +2,48 @@
 
 import logging
 
-import anthropic
+from anthropic.types import Message
 
 from cirrus_ops.config import settings
 from cirrus_ops.mining.prompts import CONTENT_GENERATION_SYSTEM, CONTENT_TYPE_PROMPTS
+from cirrus_ops.mining import claude
 from cirrus_ops.mining import profiles as profile_mod
 from cirrus_ops import db
 
 logger = logging.getLogger(__name__)
 
 
-def generate_content(
-    story_id: str,
+def _story_fields(story: dict) -> dict[str, str]:
+    """Return the placeholder values content-type prompt templates format with."""
+    return {
+        "title": story.get("title", ""),
+        "summary": story.get("summary", ""),
+        "story_text": story.get("story_text", ""),
+        "customer_name": story.get("customer_name", "Unknown"),
+        "customer_company": story.get("customer_company", "Unknown"),
+        "themes": ", ".join(story.get("themes", [])),
+    }
+
+
+def _generation_request(
+    story_fields: dict[str, str],
+    profile: dict,
     content_type: str,
-    profile_name: str = "default",
+    system_prompt: str,
     brief_context: dict | None = None,
 ) -> dict:
-    """Generate a piece of content from an extracted story using Claude.
-
-    Args:
-        story_id: The unique identifier of the extracted story.
-        content_type: The content type name (e.g., 'linkedin_post').
-        profile_name: The mining profile to use (default: "default").
-        brief_context: Optional dict with brief objective, key_messages,
-            target_personas, and tone_guidance to append to the prompt.
+    """Build the ``messages.create`` parameters for one content generation.
 
-    Returns:
-        A dict representing the inserted generated-content record.
-
-    Raises:
-        ValueError: If the story is not found or the content type is invalid.
+    ``story_fields`` (from ``_story_fields``) and ``system_prompt`` depend
+    only on the story and profile, so batch callers build them once and
+    share them across content types.
     """
-    logger.info(
-        "Generating %s content for story %s (profile: %s)",
-        content_type,
-        story_id,
-        profile_name,
-    )
-
-    story = db.get_story(story_id)
-    if story is None:
-        raise ValueError(f"Story not found: {story_id}")
-
-    # Load profile and resolve content type
-    profile = profile_mod.load_profile(profile_name)
-    profile_id = profile["id"]
-
     prompt_template, max_tokens = profile_mod.get_content_type_prompt(
         profile, content_type
     )
 
-    # Build grounded system prompt with knowledge
-    system_prompt = profile_mod.build_generation_system_prompt(profile)
-
     # Format the user prompt with story data
-    user_prompt = prompt_template.format(
-        title=story.get("title", ""),
-        summary=story.get("summary", ""),
-        story_text=story.get("story_text", ""),
-        customer_name=story.get("customer_name", "Unknown"),
-        customer_company=story.get("customer_company", "Unknown"),
-        themes=", ".join(story.get("themes", [])),
-    )
+    user_prompt = prompt_template.format_map(story_fields)
 
     # Append brief context to user prompt when provided
     if brief_context:
@@ -83,23 +63,21 @@ def generate_content(
         if brief_parts:
             user_prompt += "\n\n--- Content Brief Context ---\n" + "\n\n".join(brief_parts)
 
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-    logger.info(
-        "Calling Claude for %s generation (model: %s, max_tokens: %d)",
-        content_type,
-        settings.claude_model,
-        max_tokens,
-    )
+    return {
+        "model": settings.claude_model,
+        "max_tokens": max_tokens,
+        "system": claude.cached_system(system_prompt),
+        "messages": [{"role": "user", "content": user_prompt}],
+    }
 
-    response = client.messages.create(
-        model=settings.claude_model,
-        max_tokens=max_tokens,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_prompt}],
-    )
 
-    # Extract the generated text from the response
+def _save_generation(
+    story_id: str,
+    profile_id: str,
+    content_type: str,
+    response: Message,
+) -> dict:
+    """Persist the text of a generation response as a draft content record."""
     generated_text = ""
     for block in response.content:
         if block.type == "text":
@@ -138,10 +116,65 @@ def generate_content(
     return record
 
 
+def generate_content(
+    story_id: str,
+    content_type: str,
+    profile_name: str = "default",
+    brief_context: dict | None = None,
+) -> dict:
+    """Generate a piece of content from an extracted story using Claude.
+
+    Args:
+        story_id: The unique identifier of the extracted story.
+        content_type: The content type name (e.g., 'linkedin_post').
+        profile_name: The mining profile to use (default: "default").
+        brief_context: Optional dict with brief objective, key_messages,
+            target_personas, and tone_guidance to append to the prompt.
+
+    Returns:
+        A dict representing the inserted generated-content record.
+
+    Raises:
+        ValueError: If the story is not found or the content type is invalid.
+    """
+    logger.info(
+        "Generating %s content for story %s (profile: %s)",
+        content_type,
+        story_id,
+        profile_name,
+    )
+
+    story = db.get_story(story_id)
+    if story is None:
+        raise ValueError(f"Story not found: {story_id}")
+
+    # Load profile and resolve content type
+    profile = profile_mod.load_profile(profile_name)
+    # Build grounded system prompt with knowledge
+    system_prompt = profile_mod.build_generation_system_prompt(profile)
+    params = _generation_request(
+        _story_fields(story), profile, content_type, system_prompt, brief_context
+    )
+
+    client = claude.client()
+
+    logger.info(
+        "Calling Claude for %s generation (model: %s, max_tokens: %d)",
+        content_type,
+        settings.claude_model,
+        params["max_tokens"],
+    )
+
+    response = client.messages.create(**params)
+    return _save_generation(story_id, profile["id"], content_type, response)
+
+
 def batch_generate(
     story_id: str,
     content_types: list[str],
     profile_name: str = "default",
+    *,
+    use_batch_api: bool = False,
 ) -> list[dict]:
     """Generate multiple content types for a single story.
 
@@ -149,6 +182,9 @@ def batch_generate(
         story_id: The unique identifier of the extracted story.
         content_types: A list of content type names to generate.
         profile_name: The mining profile to use (default: "default").
+        use_batch_api: Submit all content types as one Message Batch and wait
+            for it (up to ``settings.claude_batch_max_wait_seconds``). Only for
+            offline callers; interactive callers keep the default serial path.
 
     Returns:
         A list of dicts, one per generated content record.
@@ -178,17 +214,55 @@ def batch_generate(
             f"Available for profile '{profile_name}': {', '.join(available)}"
         )
 
+    # The story fields and grounded system prompt are shared by every type
+    story_fields = _story_fields(story)
+    system_prompt = profile_mod.build_generation_system_prompt(profile)
+    # Requests are keyed by position: content-type names are free-form and
+    # may repeat, and Batch custom_ids must match ^[a-zA-Z0-9_-]{1,64}$
+    requests: dict[str, dict] = {}
+    types_by_id: dict[str, str] = {}
+    for i, content_type in enumerate(content_types):
+        custom_id = f"t{i}"
+        try:
+            requests[custom_id] = _generation_request(
+                story_fields, profile, content_type, system_prompt
+            )
+        except Exception:
+            logger.exception(
+                "Failed to build %s prompt for story %s", content_type, story_id
+            )
+            continue
+        types_by_id[custom_id] = content_type
+
+    responses: dict[str, Message | None]
+    if use_batch_api:
+        responses = claude.run_batch(requests)
+    else:
+        client = claude.client()
+        responses = {}
+        for custom_id, params in requests.items():
+            try:
+                responses[custom_id] = client.messages.create(**params)
+            except Exception:
+                logger.exception(
+                    "Failed to generate %s for story %s", types_by_id[custom_id], story_id
+                )
+                # Continue with remaining content types rather than aborting
+                responses[custom_id] = None
+
     results: list[dict] = []
-    for content_type in content_types:
+    for custom_id, response in responses.items():
+        if response is None:
+            continue
+        content_type = types_by_id[custom_id]
         try:
-            record = generate_content(story_id, content_type, profile_name)
-            results.append(record)
+            results.append(
+                _save_generation(story_id, profile["id"], content_type, response)
+            )
         except Exception:
             logger.exception(
                 "Failed to generate %s for story %s", content_type, story_id
             )
-            # Continue with remaining content types rather than aborting
-            continue
 
     logger.info(
         "Batch generation complete for story %s: %d/%d succeeded",
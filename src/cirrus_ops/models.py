@@ -81,6 +81,7 @@ class SyncState(BaseModel):
     platform: Literal["gong", "zoom"]
     last_synced_at: datetime | None = None
     last_cursor: str | None = None
+    sync_token: str | None = None
     total_synced: int = 0
     status: Literal["idle", "running", "error"] = "idle"
     error_message: str | None = None
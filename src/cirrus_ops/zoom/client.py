@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
 import time
-from typing import Any
+from pathlib import Path
+from typing import IO, Any
 
 import httpx
+import orjson
 from tenacity import (
+    RetryCallState,
     retry,
+    retry_if_exception,
     retry_if_result,
     stop_after_attempt,
     wait_exponential,
@@ -15,6 +22,8 @@ from tenacity import (
 
 from cirrus_ops.config import settings
 
+logger = logging.getLogger(__name__)
+
 ZOOM_BASE_URL = "https://api.zoom.us"
 ZOOM_OAUTH_URL = "https://zoom.us/oauth/token"
 
@@ -22,12 +31,102 @@ ZOOM_OAUTH_URL = "https://zoom.us/oauth/token"
 # edge-case failures during in-flight requests.
 _TOKEN_REFRESH_BUFFER_SECS = 60
 
+# Largest page Zoom's list endpoints accept (the default is 30), so paginated
+# calls make as few sequential round trips as possible.
+_MAX_PAGE_SIZE = 300
+
+# Upper bound on a server-requested Retry-After wait.
+_MAX_RETRY_AFTER_SECS = 60.0
+
 
 def _is_rate_limited(response: httpx.Response) -> bool:
     """Return True if the response is a 429 rate-limit error."""
     return response.status_code == 429
 
 
+def _is_rate_limit_error(exc: BaseException) -> bool:
+    """Return True if *exc* is an HTTP 429 raised by ``raise_for_status``."""
+    return (
+        isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429
+    )
+
+
+def _token_cache_key() -> str:
+    """Identify the credentials a cached token was issued for."""
+    return f"{settings.zoom_account_id}:{settings.zoom_client_id}"
+
+
+def _lock_token_cache(path: Path) -> IO[str]:
+    """Take an exclusive lock guarding the token cache; close the file to release it.
+
+    Raises ImportError on hosts without ``fcntl`` (non-POSIX), where the
+    cache is not used.
+    """
+    import fcntl
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock = path.with_suffix(".lock").open("a")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+    except BaseException:
+        lock.close()
+        raise
+    return lock
+
+
+def _read_token_cache(path: Path) -> tuple[str, float] | None:
+    """Return ``(token, seconds_remaining)`` from the cache file if still valid."""
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("key") != _token_cache_key():
+        return None
+    remaining = data.get("expires_at", 0) - time.time()
+    if remaining <= 0 or not data.get("token"):
+        return None
+    return data["token"], remaining
+
+
+def _write_token_cache(path: Path, token: str, remaining: float) -> None:
+    """Write the token to the cache file, readable by the owner only."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(
+            orjson.dumps(
+                {
+                    "key": _token_cache_key(),
+                    "token": token,
+                    "expires_at": time.time() + remaining,
+                }
+            )
+        )
+
+
+_rate_limit_backoff = wait_exponential(multiplier=1, min=1, max=30)
+
+
+def _wait_for_rate_limit(retry_state: RetryCallState) -> float:
+    """Wait as long as the 429's ``Retry-After`` header asks, else back off.
+
+    The header is honoured up to ``_MAX_RETRY_AFTER_SECS``; a missing or
+    HTTP-date value falls back to exponential backoff.
+    """
+    outcome = retry_state.outcome
+    if outcome is None:
+        return _rate_limit_backoff(retry_state)
+    if outcome.failed:
+        response = getattr(outcome.exception(), "response", None)
+    else:
+        response = outcome.result()
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return min(max(float(retry_after), 0.0), _MAX_RETRY_AFTER_SECS)
+    except (TypeError, ValueError):
+        return _rate_limit_backoff(retry_state)
+
+
 class ZoomClient:
     """Async Zoom API client with Server-to-Server OAuth and rate-limit retry.
 
@@ -38,13 +137,27 @@ class ZoomClient:
     """
 
     def __init__(self) -> None:
-        self._http = httpx.AsyncClient(timeout=httpx.Timeout(30.0))
+        self._http = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0,
+            ),
+        )
         self._access_token: str | None = None
         self._token_expires_at: float = 0.0
 
     # -- Async context manager --------------------------------------------------
 
     async def __aenter__(self) -> ZoomClient:
+        # Fetch the OAuth token up front so the first API call doesn't pay for it
+        try:
+            await self._ensure_token()
+        except BaseException:
+            await self.close()
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
@@ -60,11 +173,44 @@ class ZoomClient:
         """Obtain or refresh the Server-to-Server OAuth access token.
 
         The token is cached in memory and automatically refreshed when it is
-        within ``_TOKEN_REFRESH_BUFFER_SECS`` of expiry.
+        within ``_TOKEN_REFRESH_BUFFER_SECS`` of expiry. When
+        ``settings.zoom_token_cache_path`` is set it is also shared through
+        that file, so new processes reuse a still-valid token instead of
+        paying an OAuth round trip; a file lock keeps concurrent processes
+        from all fetching one at once.
         """
         if self._access_token and time.monotonic() < self._token_expires_at:
             return self._access_token
 
+        if not settings.zoom_token_cache_path:
+            return await self._fetch_token()
+
+        path = Path(settings.zoom_token_cache_path).expanduser()
+        try:
+            lock = await asyncio.to_thread(_lock_token_cache, path)
+        except (ImportError, OSError):
+            logger.warning("Zoom token cache unavailable at %s", path, exc_info=True)
+            return await self._fetch_token()
+
+        try:
+            cached = _read_token_cache(path)
+            if cached is not None:
+                token, remaining = cached
+                self._access_token = token
+                self._token_expires_at = time.monotonic() + remaining
+                return token
+
+            token = await self._fetch_token()
+            try:
+                _write_token_cache(path, token, self._token_expires_at - time.monotonic())
+            except OSError:
+                logger.warning("Failed to write Zoom token cache %s", path, exc_info=True)
+            return token
+        finally:
+            lock.close()
+
+    async def _fetch_token(self) -> str:
+        """Request a new access token from Zoom's OAuth endpoint."""
         response = await self._http.post(
             ZOOM_OAUTH_URL,
             params={
@@ -75,7 +221,7 @@ class ZoomClient:
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         self._access_token = data["access_token"]
         expires_in: int = data.get("expires_in", 3600)
         self._token_expires_at = time.monotonic() + expires_in - _TOKEN_REFRESH_BUFFER_SECS
@@ -86,7 +232,7 @@ class ZoomClient:
 
     @retry(
         retry=retry_if_result(_is_rate_limited),
-        wait=wait_exponential(multiplier=1, min=1, max=30),
+        wait=_wait_for_rate_limit,
         stop=stop_after_attempt(6),
     )
     async def _request(
@@ -100,7 +246,9 @@ class ZoomClient:
     ) -> httpx.Response:
         """Send an authenticated request to the Zoom API.
 
-        Retries automatically on HTTP 429 (rate limit) using exponential backoff.
+        Retries automatically on HTTP 429 (rate limit), waiting for the
+        ``Retry-After`` header when present and backing off exponentially
+        otherwise.
         For non-429 errors the response is raised immediately via
         ``raise_for_status``.
         """
@@ -151,7 +299,7 @@ class ZoomClient:
             A ``(meetings, next_page_token)`` pair.  ``next_page_token`` is
             ``None`` when there are no more pages.
         """
-        params: dict[str, Any] = {}
+        params: dict[str, Any] = {"page_size": _MAX_PAGE_SIZE}
         if from_date:
             params["from"] = from_date
         if to_date:
@@ -160,7 +308,7 @@ class ZoomClient:
             params["next_page_token"] = next_page_token
 
         resp = await self._request("GET", f"/v2/users/{user_id}/recordings", params=params)
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         meetings: list[dict[str, Any]] = data.get("meetings", [])
         token = data.get("next_page_token") or None
@@ -169,7 +317,7 @@ class ZoomClient:
     async def get_meeting(self, meeting_id: str | int) -> dict[str, Any]:
         """Fetch details for a single meeting."""
         resp = await self._request("GET", f"/v2/meetings/{meeting_id}")
-        return resp.json()
+        return orjson.loads(resp.content)
 
     async def get_participants(self, meeting_id: str | int) -> list[dict[str, Any]]:
         """Fetch the participant list for a past meeting.
@@ -180,7 +328,7 @@ class ZoomClient:
         next_token: str | None = None
 
         while True:
-            params: dict[str, Any] = {}
+            params: dict[str, Any] = {"page_size": _MAX_PAGE_SIZE}
             if next_token:
                 params["next_page_token"] = next_token
 
@@ -189,7 +337,7 @@ class ZoomClient:
                 f"/v2/past_meetings/{meeting_id}/participants",
                 params=params,
             )
-            data = resp.json()
+            data = orjson.loads(resp.content)
             all_participants.extend(data.get("participants", []))
 
             next_token = data.get("next_page_token") or None
@@ -203,7 +351,28 @@ class ZoomClient:
         resp = await self._request("GET", download_url)
         return resp.text
 
-    async def download_recording(self, download_url: str) -> bytes:
-        """Download a recording file and return the raw bytes."""
-        resp = await self._request("GET", download_url)
-        return resp.content
+    @retry(
+        retry=retry_if_exception(_is_rate_limit_error),
+        wait=_wait_for_rate_limit,
+        stop=stop_after_attempt(6),
+        reraise=True,
+    )
+    async def download_recording(
+        self, download_url: str, dest: Path, chunk_size: int = 1 << 20
+    ) -> int:
+        """Stream a recording file to *dest* and return the number of bytes written.
+
+        Recordings can run to gigabytes, so the body is written to disk in
+        *chunk_size* pieces instead of being buffered in memory.
+        """
+        token = await self._ensure_token()
+        headers = {"Authorization": f"Bearer {token}"}
+
+        written = 0
+        async with self._http.stream("GET", download_url, headers=headers) as response:
+            response.raise_for_status()
+            with dest.open("wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    await asyncio.to_thread(f.write, chunk)
+                    written += len(chunk)
+        return written
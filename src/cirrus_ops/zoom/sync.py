@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import logging
 import re
-import uuid
-from datetime import datetime
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
 from cirrus_ops.config import settings
@@ -168,10 +169,30 @@ def _find_media_files(recording_files: list[dict[str, Any]]) -> list[dict[str, A
 # ---------------------------------------------------------------------------
 
 
-async def _sync_meetings(client: ZoomClient, from_date: str, to_date: str | None = None) -> int:
+def _advance_sync_token(token: str | None, meeting: dict[str, Any]) -> str | None:
+    """Return the later of *token* and the meeting's ``start_time`` (UTC ISO)."""
+    start_time = meeting.get("start_time")
+    if not start_time:
+        return token
+    try:
+        started = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+    except ValueError:
+        return token
+    if token and datetime.fromisoformat(token) >= started:
+        return token
+    return started.astimezone(timezone.utc).isoformat()
+
+
+async def _sync_meetings(
+    client: ZoomClient,
+    from_date: str,
+    to_date: str | None = None,
+    sync_token: str | None = None,
+) -> tuple[int, str | None]:
     """Core sync loop shared by bulk and incremental sync.
 
-    Returns the total number of meetings synced.
+    Returns the total number of meetings synced and the advanced sync token
+    (the latest recording ``start_time`` seen, starting from *sync_token*).
     """
     total_synced = 0
     next_page_token: str | None = None
@@ -186,6 +207,7 @@ async def _sync_meetings(client: ZoomClient, from_date: str, to_date: str | None
 
         for meeting in meetings:
             batch.append(meeting)
+            sync_token = _advance_sync_token(sync_token, meeting)
 
             if len(batch) >= settings.sync_batch_size:
                 total_synced += await _process_batch(client, batch)
@@ -198,7 +220,7 @@ async def _sync_meetings(client: ZoomClient, from_date: str, to_date: str | None
     if batch:
         total_synced += await _process_batch(client, batch)
 
-    return total_synced
+    return total_synced, sync_token
 
 
 async def _process_batch(client: ZoomClient, meetings: list[dict[str, Any]]) -> int:
@@ -288,15 +310,17 @@ async def _process_batch(client: ZoomClient, meetings: list[dict[str, Any]]) ->
                         mf.get("file_extension", ""), "application/octet-stream"
                     )
 
-                    file_bytes = await client.download_recording(download_url)
-                    db.upload_to_storage("recordings", storage_path, file_bytes, content_type)
+                    with tempfile.TemporaryDirectory() as tmp_dir:
+                        local_path = Path(tmp_dir) / f"{recording_type}.{file_ext}"
+                        file_size = await client.download_recording(download_url, local_path)
+                        with local_path.open("rb") as f:
+                            db.upload_to_storage("recordings", storage_path, f, content_type)
                     db.insert_media(
                         {
-                            "id": str(uuid.uuid4()),
                             "meeting_id": meeting_id,
                             "media_type": recording_type,
                             "storage_path": storage_path,
-                            "file_size_bytes": mf.get("file_size", len(file_bytes)),
+                            "file_size_bytes": mf.get("file_size", file_size),
                             "format": file_ext,
                             "source_url": download_url,
                         }
@@ -339,9 +363,9 @@ async def bulk_sync() -> None:
 
     try:
         async with ZoomClient() as client:
-            total = await _sync_meetings(client, from_date="2020-01-01")
+            total, sync_token = await _sync_meetings(client, from_date="2020-01-01")
 
-        db.set_sync_complete(PLATFORM, total_synced=total)
+        db.set_sync_complete(PLATFORM, total_synced=total, sync_token=sync_token)
         logger.info("Zoom bulk sync complete — %d meetings synced", total)
 
     except Exception as exc:
@@ -352,12 +376,18 @@ async def bulk_sync() -> None:
 
 
 async def incremental_sync() -> None:
-    """Run an incremental sync starting from the last successful sync timestamp."""
+    """Run an incremental sync starting from the stored sync token.
+
+    The token is the latest recording start time seen by a previous run;
+    ``last_synced_at`` is used for state rows written before tokens existed.
+    """
     logger.info("Starting Zoom incremental sync")
 
-    sync_state = db.get_sync_state(PLATFORM)
-    if sync_state and sync_state.get("last_synced_at"):
-        from_date = sync_state["last_synced_at"][:10]  # YYYY-MM-DD
+    sync_state = db.get_sync_state(PLATFORM) or {}
+    sync_token: str | None = sync_state.get("sync_token")
+    since = sync_token or sync_state.get("last_synced_at")
+    if since:
+        from_date = since[:10]  # YYYY-MM-DD
     else:
         # Fall back to bulk-style start if we have never synced.
         from_date = "2020-01-01"
@@ -367,9 +397,11 @@ async def incremental_sync() -> None:
 
     try:
         async with ZoomClient() as client:
-            total = await _sync_meetings(client, from_date=from_date)
+            total, sync_token = await _sync_meetings(
+                client, from_date=from_date, sync_token=sync_token
+            )
 
-        db.set_sync_complete(PLATFORM, total_synced=total)
+        db.set_sync_complete(PLATFORM, total_synced=total, sync_token=sync_token)
         logger.info("Zoom incremental sync complete — %d meetings synced", total)
 
     except Exception as exc:
@@ -0,0 +1,30 @@
+-- Migration 008: replace_participants()
+-- Replaces a meeting's participants in a single transaction and round trip.
+-- Rows come in as a JSON array of participant objects; ids come from the
+-- column default.
+
+CREATE OR REPLACE FUNCTION replace_participants(p_meeting_id UUID, p_rows JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted INTEGER;
+BEGIN
+    DELETE FROM participants WHERE meeting_id = p_meeting_id;
+
+    INSERT INTO participants (
+        meeting_id, name, email, company, role, is_customer, speaker_id, raw_metadata
+    )
+    SELECT
+        p_meeting_id,
+        r.name,
+        r.email,
+        r.company,
+        r.role,
+        coalesce(r.is_customer, false),
+        r.speaker_id,
+        coalesce(r.raw_metadata, '{}'::jsonb)
+    FROM jsonb_populate_recordset(NULL::participants, coalesce(p_rows, '[]'::jsonb)) AS r;
+
+    GET DIAGNOSTICS inserted = ROW_COUNT;
+    RETURN inserted;
+END;
+$$ LANGUAGE plpgsql;
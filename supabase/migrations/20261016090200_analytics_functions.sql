@@ -0,0 +1,43 @@
+-- Migration 009: Analytics aggregation functions
+-- Group-by rollups for the analytics endpoints, so the API receives one row
+-- per group instead of every story/content row.
+
+CREATE OR REPLACE FUNCTION theme_counts()
+RETURNS TABLE (theme TEXT, count BIGINT) AS $$
+    SELECT t.theme, count(*)
+    FROM extracted_stories s,
+        jsonb_array_elements_text(s.themes) AS t(theme)
+    WHERE jsonb_typeof(s.themes) = 'array'
+    GROUP BY t.theme
+    ORDER BY 2 DESC, 1;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION sentiment_breakdown(p_profile_id UUID DEFAULT NULL)
+RETURNS TABLE (sentiment TEXT, count BIGINT, percentage FLOAT) AS $$
+    SELECT
+        coalesce(s.sentiment, 'unknown'),
+        count(*),
+        round(count(*) * 100.0 / sum(count(*)) OVER (), 1)::float
+    FROM extracted_stories s
+    WHERE p_profile_id IS NULL OR s.profile_id = p_profile_id
+    GROUP BY 1
+    ORDER BY 2 DESC, 1;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION top_companies(p_limit INTEGER DEFAULT 10)
+RETURNS TABLE (company TEXT, story_count BIGINT) AS $$
+    SELECT s.customer_company, count(*)
+    FROM extracted_stories s
+    WHERE s.customer_company IS NOT NULL AND s.customer_company <> ''
+    GROUP BY s.customer_company
+    ORDER BY 2 DESC, 1
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION content_pipeline(p_profile_id UUID DEFAULT NULL)
+RETURNS TABLE (status TEXT, count BIGINT) AS $$
+    SELECT coalesce(c.status::text, 'draft'), count(*)
+    FROM generated_content c
+    WHERE p_profile_id IS NULL OR c.profile_id = p_profile_id
+    GROUP BY 1;
+$$ LANGUAGE sql STABLE;
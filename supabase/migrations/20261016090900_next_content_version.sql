@@ -0,0 +1,13 @@
+-- Migration 016: Next content version
+-- MAX(version) + 1 for a story/content type pair as a single scalar query,
+-- served by an index on the pair.
+
+CREATE INDEX IF NOT EXISTS idx_generated_content_story_type_version
+    ON generated_content (story_id, content_type, version DESC);
+
+CREATE OR REPLACE FUNCTION next_content_version(p_story_id UUID, p_content_type TEXT)
+RETURNS INTEGER AS $$
+    SELECT coalesce(max(version), 0) + 1
+    FROM generated_content
+    WHERE story_id = p_story_id AND content_type = p_content_type;
+$$ LANGUAGE sql STABLE;
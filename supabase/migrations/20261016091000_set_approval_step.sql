@@ -0,0 +1,35 @@
+-- Migration 017: Atomic approval step updates
+-- Sets the status/approver/notes/timestamp of one stage in a content
+-- record's approval_chain with a single UPDATE, stamping the time with the
+-- database clock. Returns the updated row (no rows if the id is unknown).
+
+CREATE OR REPLACE FUNCTION set_approval_step(
+    p_content_id UUID,
+    p_stage TEXT,
+    p_status TEXT,
+    p_person TEXT,
+    p_notes TEXT DEFAULT NULL
+)
+RETURNS SETOF generated_content AS $$
+    UPDATE generated_content c
+    SET approval_chain = coalesce(
+        (
+            SELECT jsonb_agg(
+                CASE WHEN e.step->>'stage' = p_stage
+                    THEN e.step || jsonb_build_object(
+                        'status', p_status,
+                        'approved_by', p_person,
+                        'notes', p_notes,
+                        'timestamp', now()
+                    )
+                    ELSE e.step
+                END
+                ORDER BY e.ord
+            )
+            FROM jsonb_array_elements(c.approval_chain) WITH ORDINALITY AS e(step, ord)
+        ),
+        '[]'::jsonb
+    )
+    WHERE c.id = p_content_id
+    RETURNING c.*;
+$$ LANGUAGE sql;